@@ -1,36 +1,196 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
-import pandas as pd
 import os
+import sys
+import threading
 import time
+import json
+import argparse
+import atexit
+from functools import lru_cache
+import hashlib
+import pathlib
+import re
+import zlib
+from dataclasses import dataclass, asdict
 from multiprocessing import Pool, cpu_count
-from flask import Flask, render_template, request, jsonify
-
-# Optional: keep matplotlib for CLI plotting
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
-
-# Set random seed for reproducibility
-np.random.seed(42)
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: Numba JIT for the simulation hot path (falls back to NumPy when missing)
+# Size Numba's thread pool to every core unless the user already chose a value
+os.environ.setdefault('NUMBA_NUM_THREADS', str(cpu_count()))
+try:
+    from numba import njit, prange, config as numba_config, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: orjson backs the web app's JSON encoding/decoding and the parsing of
+# API payloads, much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decoder for raw JSON bytes (HTTP bodies, cache files); orjson skips the UTF-8 decode
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Random seed for reproducibility (root of the per-worker SeedSequence streams)
+SEED = 42
 
 # Number of Monte Carlo simulations
 N = 100_000
 
+# On-disk cache for TheSportsDB player lookups; entries older than
+# BOXING_CACHE_TTL seconds (default: one day) are refetched
+CACHE_DIR = pathlib.Path.home() / '.cache' / 'boxingmc'
+CACHE_TTL = int(os.getenv('BOXING_CACHE_TTL', '86400'))
+
+# Height/weight formats returned by the APIs: 6ft 2in, 6'2", 185 cm, 185 / 170 lbs, 77 kg, 170
+HEIGHT_RE = re.compile(
+    r"""^\s*(?:(?P<feet>\d+)\s*(?:ft|')\s*(?:(?P<inches>\d+)\s*(?:in|")?)?
+                |(?P<value>\d+(?:\.\d+)?)\s*(?:cm)?)\s*$""",
+    re.IGNORECASE | re.VERBOSE
+)
+WEIGHT_RE = re.compile(r"^\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>lbs?|kg)?\s*$", re.IGNORECASE)
+
 # Standard deviations for physical attributes
 std_height = 1
 std_reach = 1
+
+# Fights per independently seeded chunk in the Numba kernel
+KERNEL_CHUNK = 4096
+
+# Fights scored per tile in the NumPy path; keeps each tile's working set cache-sized
+# (6 float32 normals per fight: 16,384 fights is a 384 KiB block, well inside L2)
+SIM_TILE = 16_384
+
+# Bounds on n_simulations accepted by /api/simulate (the cap keeps responses fast)
+MIN_N = 1_000
+MAX_N = 200_000
+
+# Below these sizes forking a Pool costs more than the simulations themselves
+POOL_MIN_SIMULATIONS = 50_000
+POOL_MIN_PER_CORE = 5_000
+
+# Early stopping: fights per convergence check and the z-score of its 99% interval
+EARLY_STOP_CHUNK = 10_000
+CI_Z_99 = 2.576
+
+# Precomputed reciprocals of the advantage normalizers (multiply instead of divide)
+INV_200 = 1.0 / 200
+INV_460 = 1.0 / 460
+
+# Scoring model: weights for win rate, KO rate, height, reach and weight class, the
+# per-fighter noise sigma and the draw threshold. Numba freezes module globals as
+# compile-time constants, so the JIT kernel is specialized on these exact values.
+W_WIN = 0.37
+W_KO = 0.15
+W_HEIGHT = 0.08
+W_REACH = 0.05
+W_WEIGHT = 0.35
+NOISE_SIGMA = 0.1
+DRAW_THRESHOLD = 0.02
+
+# Advantage weights folded with their normalizers
+HEIGHT_COEF = INV_200 * W_HEIGHT
+REACH_COEF = INV_200 * W_REACH
+WEIGHT_COEF = INV_460 * W_WEIGHT
+
+# Weights of the (win, KO, height, reach, weight, noise) differences in score1 - score2.
+# The physical advantage is added to fighter 1 and subtracted from fighter 2, so it
+# counts twice in the difference.
+DIFF_WEIGHTS = np.array([W_WIN, W_KO, 2 * HEIGHT_COEF, 2 * REACH_COEF, 2 * WEIGHT_COEF, 1.0])
+SQRT_2 = np.sqrt(2.0)
+
+def _orjson_provider(app):
+    """
+    Flask JSON provider backed by orjson (NumPy scalars allowed), so `jsonify`,
+    `request.get_json` and `app.json.dumps` all skip the stdlib encoder.
+    """
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    return OrjsonProvider(app)
+
+
 def create_app():
     """Create and configure the Flask app that serves a small UI.
     The API endpoints allow listing available fighters and running simulations.
     """
+    # Flask is only imported for the web entry point; the CLI never pays for it
+    from flask import Flask, Response, render_template, request, jsonify
+
     app = Flask(__name__, template_folder='templates', static_folder='static')
+    if ORJSON_AVAILABLE:
+        app.json = _orjson_provider(app)
+    # Where the optional /api/simulate chart is written and served from
+    # (one file per matchup, see api_simulate)
+    app.config['PLOT_DIR'] = app.static_folder
+    app.config['PLOT_URL'] = '/static/'
 
     # Initialize API (module-level) using env var or free tier
     # Prefer the documented free/demo key '123' when no env var is set
     api_key = os.getenv('THESPORTSDB_API_KEY') or '123'
-    api = BoxingAPI(api_key=api_key)
+    app.config['USE_LOCAL_DB_FALLBACK'] = _env_flag('USE_LOCAL_DB_FALLBACK', True)
+    api = BoxingAPI(api_key=api_key, use_local_fallback=app.config['USE_LOCAL_DB_FALLBACK'])
+
+    # Compile/load the Numba kernel now so the first request isn't charged for it
+    # (set NUMBA_WARMUP=0 to skip, e.g. for quick test apps)
+    if _env_flag('NUMBA_WARMUP', True):
+        warmup_kernel()
+    # Without Numba, large runs go through a process pool; start it once for
+    # the app's lifetime rather than paying fork/spawn on every request
+    app.config['MP_POOL'] = None
+    if not NUMBA_AVAILABLE and cpu_count() > 1:
+        app.config['MP_POOL'] = _shared_pool()
     # RapidAPI/events removed
 
+    # The local DB is fixed for the app's lifetime, so the /api/fighters
+    # body is encoded once
+    fighter_names = api._fighter_names
+    fighters_body = app.json.dumps({'fighters': fighter_names})
+
+    # One background writer keeps chart file I/O off the request path
+    plot_executor = ThreadPoolExecutor(max_workers=1)
+
+    @lru_cache(maxsize=512)
+    def derived_keys(f1_key, f2_key):
+        """
+        Memoized `_derive_rates` for a pair of `_stats_key` keys, returning the
+        keys of the rate-augmented stats, so repeat matchups skip the derivation.
+        """
+        f1_stats, f2_stats = _derive_rates(dict(f1_key), dict(f2_key))
+        return _stats_key(f1_stats), _stats_key(f2_stats)
+
+    # Set by simulate_cached's body in the calling thread, so a request can tell
+    # whether its own call ran the simulation (cache_info() counts are shared
+    # by every thread and race under concurrent requests)
+    sim_miss = threading.local()
+
+    @lru_cache(maxsize=256)
+    def simulate_cached(f1_key, f2_key, n, use_mp, tolerance):
+        """
+        Memoized `monte_carlo_simulation` keyed on both fighters' stats (see
+        `_stats_key`), n and the early-stop tolerance. Each matchup gets its own
+        stream seeded from SEED and `_matchup_seed`, so a cached result is
+        identical to a fresh run (and to one after a restart).
+        """
+        sim_miss.ran = True
+        return monte_carlo_simulation(dict(f1_key), dict(f2_key), n_simulations=n,
+                                      use_multiprocessing=use_mp, tolerance=tolerance,
+                                      seed=(SEED, _matchup_seed(f1_key, f2_key, n)),
+                                      pool=app.config['MP_POOL'])
+
     @app.route('/')
     def index():
         # Render the UI; JS will fetch fighters and submit simulation requests
@@ -38,7 +198,23 @@ def create_app():
 
     @app.route('/api/fighters')
     def list_fighters():
-        return jsonify({'fighters': list(api.fighter_db.keys())})
+        return Response(fighters_body, mimetype='application/json')
+
+    @app.route('/api/fighter')
+    def get_fighter():
+        # Look up one fighter's stats; lookups are memoized by BoxingAPI, so this
+        # also warms the cache ahead of /api/simulate calls for the same name
+        name = (request.args.get('name') or '').strip()
+        if not name:
+            return jsonify({'error': 'name required'}), 400
+        stats = api.get_fighter_stats(name)
+        if not stats:
+            return jsonify({
+                'error': f"Fighter '{name}' not found via API or schedule search.",
+                'available_fighters': fighter_names,
+                'debug': api.last_search_debug.get(name, [])
+            }), 404
+        return jsonify({'fighter': stats})
 
     # /api/events removed
 
@@ -48,71 +224,94 @@ def create_app():
         payload = request.get_json() or {}
         f1 = payload.get('fighter1') or payload.get('fighter1_name')
         f2 = payload.get('fighter2') or payload.get('fighter2_name')
+        # Clamp to [MIN_N, MAX_N] up front so bad input never reaches the simulation
         try:
-            n = int(payload.get('n_simulations', N))
+            n = min(max(int(payload.get('n_simulations', N)), MIN_N), MAX_N)
         except Exception:
             n = N
-        # Multiprocessing is enabled by default server-side
-        use_mp = True
+        # Optional early stopping: 99% interval half-width to stop at (e.g. 0.005)
+        try:
+            tolerance = float(payload['tolerance']) if payload.get('tolerance') is not None else None
+        except (TypeError, ValueError):
+            tolerance = None
+        if tolerance is not None and tolerance <= 0:
+            tolerance = None
+        # Parallelism only pays off for large runs; below the Pool threshold a
+        # single thread/process is faster than the dispatch overhead
+        use_mp = n >= POOL_MIN_SIMULATIONS
 
         if not f1 or not f2:
             return jsonify({'error': 'fighter1 and fighter2 required'}), 400
+        # Identical names are rejected before any lookup; aliases of the same
+        # fighter (e.g. 'AJ' and 'Anthony Joshua') are caught once resolved below
+        same_fighter = {'error': 'fighter1 and fighter2 must be different fighters'}
+        if f1.strip().lower() == f2.strip().lower():
+            return jsonify(same_fighter), 400
 
         # Validate fighters and provide clear error messages when data is missing
         # Fetch fighter stats; if missing, return error
         warnings = []
-        f1_stats = api.get_fighter_stats(f1)
-        f2_stats = api.get_fighter_stats(f2)
+        # Both lookups run concurrently; each may take several network round trips
+        f1_stats, f2_stats = api.get_fighters_stats([f1, f2])
         
         # Check for missing fighters - if not in local DB and no good API data, reject
         if not f1_stats:
             return jsonify({
                 'error': f"Fighter '{f1}' not found via API or schedule search.",
                 'suggestion': "Please check the spelling and try again.",
-                'available_fighters': list(api.fighter_db.keys()),
+                'available_fighters': fighter_names,
                 'debug': api.last_search_debug.get(f1, [])
             }), 404
         if not f2_stats:
             return jsonify({
                 'error': f"Fighter '{f2}' not found via API or schedule search.",
                 'suggestion': "Please check the spelling and try again.",
-                'available_fighters': list(api.fighter_db.keys()),
+                'available_fighters': fighter_names,
                 'debug': api.last_search_debug.get(f2, [])
             }), 404
-
-        # Build DataFrames from validated stats and compute derived rates
-        f1_df = pd.DataFrame([f1_stats])
-        f2_df = pd.DataFrame([f2_stats])
-        # Ensure totals are safe (validate_stats already adjusts total_bouts)
-        for df in (f1_df, f2_df):
-            tb = df.at[0, 'total_bouts'] if 'total_bouts' in df.columns else 1
-            wins = df.at[0, 'wins'] if 'wins' in df.columns else 0
-            ko_wins = df.at[0, 'ko_wins'] if 'ko_wins' in df.columns else 0
-            df['win_rate'] = wins / tb if tb and tb > 0 else 0
-            # FIXED: KO rate should be KO wins out of total bouts, not just wins
-            # This prevents sample size bias (e.g., 4 wins/4 KOs shouldn't be compared to 45 wins/40 KOs)
-            df['ko_rate'] = ko_wins / tb if tb and tb > 0 else 0
-
-        # Cap simulations for web responsiveness
-        if n > 200_000:
-            n = 200_000
-
-        results = monte_carlo_simulation(f1_df, f2_df, n_simulations=n, use_multiprocessing=use_mp)
-
-        # Save a server-side matplotlib PNG for quick preview
-        try:
-            plot_path = os.path.join('static', 'last_plot.png')
-            save_plot_png(results, f1, f2, plot_path)
-            plot_url = f"/static/last_plot.png"
-        except Exception:
-            plot_url = None
+        if (str(f1_stats.get('name', f1)).lower(), f1_stats.get('source')) == \
+                (str(f2_stats.get('name', f2)).lower(), f2_stats.get('source')):
+            return jsonify(same_fighter), 400
+
+        # Derived rates for both fighters (memoized per pair of records); the
+        # response gets fresh dicts built from the cached keys
+        f1_key, f2_key = derived_keys(_stats_key(f1_stats), _stats_key(f2_stats))
+        f1_stats, f2_stats = dict(f1_key), dict(f2_key)
+
+        # The model is symmetric, so a matchup and its mirror share one cache
+        # entry: simulate in a canonical order and swap the sides back if needed
+        swapped = repr(f2_key) < repr(f1_key)
+        sim_miss.ran = False
+        if swapped:
+            results = _swap_sides(simulate_cached(f2_key, f1_key, n, use_mp, tolerance))
+        else:
+            results = dict(simulate_cached(f1_key, f2_key, n, use_mp, tolerance))
+        cached = not sim_miss.ran
+
+        # Save a server-side SVG chart for quick preview, only when the
+        # client asks for it with ?plot=1 (or "plot": true in the payload)
+        # Each matchup (sides, n and tolerance) gets its own file, so concurrent
+        # requests never overwrite each other's chart. The write runs in the
+        # background and the response doesn't wait for it: plot_url may 404
+        # for a moment until the file lands, and a failed write is logged
+        plot_url = None
+        if request.args.get('plot') == '1' or payload.get('plot') is True:
+            filename = f"last_plot_{_matchup_seed(f1_key, f2_key, (n, tolerance)):08x}.svg"
+            future = plot_executor.submit(save_plot_svg, results, f1_stats.get('name', f1), f2_stats.get('name', f2),
+                                          os.path.join(app.config['PLOT_DIR'], filename))
+            future.add_done_callback(_log_plot_error)
+            plot_url = app.config['PLOT_URL'] + filename
 
         # Check for significant weight class differences and add warning
-        weight_diff = abs(f2_stats.get('weight', 170) - f1_stats.get('weight', 170))
+        w1 = f1_stats.get('weight', 170)
+        w2 = f2_stats.get('weight', 170)
+        weight_diff = abs(w2 - w1)
         if weight_diff > 25:  # Significant weight class difference
             weight_classes = round(weight_diff / 15)
-            heavier_fighter = f2_stats.get('name', 'Fighter 2') if f2_stats.get('weight', 170) > f1_stats.get('weight', 170) else f1_stats.get('name', 'Fighter 1')
-            heavier_pct = results['fighter2_win_pct'] if f2_stats.get('weight', 170) > f1_stats.get('weight', 170) else results['fighter1_win_pct']
+            if w2 > w1:
+                heavier_fighter, heavier_pct = f2_stats.get('name', 'Fighter 2'), results['fighter2_win_pct']
+            else:
+                heavier_fighter, heavier_pct = f1_stats.get('name', 'Fighter 1'), results['fighter1_win_pct']
             
             warnings.append(f"⚠️  WEIGHT CLASS NOTICE: {heavier_fighter} is ~{weight_classes} weight class{'es' if weight_classes > 1 else ''} heavier ({weight_diff} lbs). "
                           f"This significantly favors {heavier_fighter} ({heavier_pct:.1f}% win rate). "
@@ -121,9 +320,10 @@ def create_app():
         # Prepare response
         resp = {
             'results': results,
-            'fighter1': f1_df.iloc[0].to_dict(),
-            'fighter2': f2_df.iloc[0].to_dict(),
+            'fighter1': f1_stats,
+            'fighter2': f2_stats,
             'plot_url': plot_url,
+            'cached': cached,
             'warnings': warnings,
             'api_search_debug': {
                 'fighter1': api.last_search_debug.get(f1, []),
@@ -135,9 +335,195 @@ def create_app():
     return app
 
 
+@lru_cache(maxsize=1024)
+def _parse_height(height_str):
+    """Parse a height string (6ft 2in, 6'2", 185 cm, 185) to cm; 180 if unparseable."""
+    m = HEIGHT_RE.match(height_str)
+    if not m:
+        print(f"  Warning: Could not parse height '{height_str}'")
+        return 180
+    
+    # Convert from feet and inches
+    if m.group('feet'):
+        feet = int(m.group('feet'))
+        inches = int(m.group('inches') or 0)
+        return int((feet * 12 + inches) * 2.54)
+    
+    # Plain number, already in cm
+    return int(float(m.group('value')))
+
+
+@lru_cache(maxsize=1024)
+def _parse_weight(weight_str):
+    """Parse a weight string (170 lbs, 77 kg, 170) to lbs; 160 if unparseable."""
+    m = WEIGHT_RE.match(weight_str)
+    if not m:
+        print(f"  Warning: Could not parse weight '{weight_str}'")
+        return 160
+    
+    # Convert from kg; lbs and bare numbers are used as-is
+    value = float(m.group('value'))
+    if (m.group('unit') or '').lower() == 'kg':
+        return int(value * 2.20462)
+    return int(value)
+
+
+# Conservative stats for a fighter only known from the RapidAPI schedule; they
+# let a simulation run without dividing by zero
+_SCHEDULE_DEFAULT_STATS = {
+    'name': None,
+    'wins': 1,
+    'losses': 0,
+    'draws': 0,
+    'total_bouts': 1,
+    'ko_wins': 0,
+    'height': 180,
+    'reach': 180,
+    'weight': 170,
+    'source': 'rapidapi.schedule'
+}
+
+# Where RapidAPI fighter-detail payloads keep their list of records, in the
+# order tried, and the keys that mark a payload as a single fighter record
+_FIGHTER_LIST_KEYS = ('data', 'fighters', 'boxers', 'results', 'items')
+_FIGHTER_NAME_KEYS = frozenset(('name', 'fighter_name', 'fullName', 'first_name'))
+
+
+# Common nicknames for fighters in the local DB (lower-case -> fighter_db key)
+FIGHTER_ALIASES = {
+    'aj': 'Anthony Joshua',
+    'bud': 'Terence Crawford',
+    'canelo': 'Canelo Alvarez',
+    'gypsy king': 'Tyson Fury',
+    'iron mike': 'Mike Tyson',
+    'money': 'Floyd Mayweather',
+    'pacman': 'Manny Pacquiao',
+    'the greatest': 'Muhammad Ali',
+    'ggg': 'Gennady Golovkin',
+    'bronze bomber': 'Deontay Wilder',
+    'tank': 'Gervonta Davis',
+    'loma': 'Vasiliy Lomachenko',
+    'monster': 'Naoya Inoue',
+}
+
+
+def _env_flag(name, default):
+    """Read a boolean environment variable ('1', 'true', 'yes' are true)."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def _coerce_int(record, keys, default=0):
+    """
+    Integer value of the first of `keys` present in `record` with a usable
+    value (not None/'' and int-convertible), else `default`.
+    """
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ''):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                pass
+    return default
+
+
+def _derive_rates(*fighters):
+    """
+    Return copies of the `fighters` stats dicts with win_rate and ko_rate
+    added (per total bout, 0 with no bouts).
+    """
+    derived = []
+    for f in fighters:
+        tb = f.get('total_bouts', 1)
+        safe = tb and tb > 0
+        # FIXED: KO rate should be KO wins out of total bouts, not just wins
+        # This prevents sample size bias (e.g., 4 wins/4 KOs shouldn't be compared to 45 wins/40 KOs)
+        derived.append(dict(f, win_rate=f.get('wins', 0) / tb if safe else 0,
+                            ko_rate=f.get('ko_wins', 0) / tb if safe else 0))
+    return derived
+
+
+def _log_plot_error(future):
+    """Done callback for background chart writes: report a failed write."""
+    if future.exception() is not None:
+        print(f"⚠ Could not save plot: {future.exception()}")
+
+
+def _matchup_seed(f1_key, f2_key, n):
+    """Stable 32-bit seed for a matchup (crc32, unlike hash(), is the same in every process)."""
+    return zlib.crc32(repr((f1_key, f2_key, n)).encode())
+
+
+def _swap_sides(results):
+    """Copy of a `monte_carlo_simulation` result with fighter1 and fighter2 exchanged."""
+    swapped = dict(results)
+    for field in ('wins', 'win_pct'):
+        swapped[f'fighter1_{field}'] = results[f'fighter2_{field}']
+        swapped[f'fighter2_{field}'] = results[f'fighter1_{field}']
+    return swapped
+
+
+def _stats_key(stats):
+    """Hashable, order-independent cache key for a stats dict."""
+    return tuple(sorted(stats.items()))
+
+
+@dataclass(frozen=True)
+class FighterStats:
+    """Fighter record and physical attributes used by the simulation."""
+    __slots__ = ('name', 'wins', 'losses', 'draws', 'total_bouts', 'ko_wins',
+                 'height', 'reach', 'weight', 'source')
+    name: str
+    wins: int
+    losses: int
+    draws: int
+    total_bouts: int
+    ko_wins: int
+    height: float
+    reach: float
+    weight: float
+    source: str
+
+    @classmethod
+    def from_stats(cls, stats):
+        """Build from a stats dict as returned by `BoxingAPI.get_fighter_stats`."""
+        return cls(
+            name=stats.get('name', 'Unknown'),
+            wins=int(stats.get('wins', 0)),
+            losses=int(stats.get('losses', 0)),
+            draws=int(stats.get('draws', 0)),
+            total_bouts=int(stats.get('total_bouts', 1)),
+            ko_wins=int(stats.get('ko_wins', 0)),
+            height=float(stats['height']),
+            reach=float(stats['reach']),
+            weight=float(stats.get('weight', 170)),
+            source=stats.get('source', 'unknown')
+        )
+
+    @property
+    def win_rate(self):
+        return self.wins / self.total_bouts if self.total_bouts > 0 else 0
+
+    @property
+    def ko_rate(self):
+        return self.ko_wins / self.total_bouts if self.total_bouts > 0 else 0
+
+    def to_dict(self):
+        """Plain dict of the fields plus the derived rates."""
+        return dict(asdict(self), win_rate=self.win_rate, ko_rate=self.ko_rate)
+
+
 class BoxingAPI:
     """Boxing API wrapper and local fallback database."""
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, use_local_fallback=None):
+        # Local DB fallback switch; read from USE_LOCAL_DB_FALLBACK once unless given
+        if use_local_fallback is None:
+            use_local_fallback = _env_flag('USE_LOCAL_DB_FALLBACK', True)
+        self.use_local_fallback = use_local_fallback
+
         # Check if premium API key is provided
         if api_key and api_key not in ['3', '123']:
             self.base_url = "https://www.thesportsdb.com/api/v2/json"
@@ -156,6 +542,34 @@ class BoxingAPI:
             self.headers = {}
             print(f"\n🔌 Initialized TheSportsDB API (Free - v1, Key: {self.api_key})")
 
+        # Candidate search URLs to try, fixed per instance (covers v1/v2 and
+        # presence/absence of key in path)
+        if self.is_premium:
+            self._search_candidates = (f"{self.base_url}/searchplayers.php",
+                                       f"{self.base_url}/all/searchplayers.php")
+        else:
+            # v1: base_url already is https://www.thesportsdb.com/api/v1/json
+            self._search_candidates = (f"{self.base_url}/{self.api_key}/searchplayers.php",
+                                       f"{self.base_url}/searchplayers.php")
+
+        # Shared keep-alive session so repeated searches reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # RapidAPI gets its own keep-alive session so the TheSportsDB headers
+        # (the premium key) never reach it, and carries its own auth headers.
+        # Allow override via env var RAPIDAPI_KEY; fall back to a bundled key if not set
+        rapid_key = os.getenv('RAPIDAPI_KEY') or '954b586842msha9c5947f76e426bp13b543jsnd28cc99ca940'
+        self.rapid_session = requests.Session()
+        self.rapid_session.headers.update({
+            'x-rapidapi-host': 'boxing-data-api.p.rapidapi.com',
+            'x-rapidapi-key': rapid_key
+        })
+        self.rapid_session.mount('https://', adapter)
+
         # Fallback local database
         self.fighter_db = {
             # --- Your original core guys (updated with real stats) ---
@@ -452,63 +866,28 @@ class BoxingAPI:
                 'height': 178, 'reach': 180, 'ko_wins': 21, 'weight': 154
             }
         }
+        # Case-insensitive index over the curated names
+        self._db_index = {key.lower(): key for key in self.fighter_db}
+        # Curated names in DB order, for dropdowns and "not found" responses
+        self._fighter_names = list(self.fighter_db)
         # store debug info for last searches
         self.last_search_debug = {}
+        # in-process memo of successful lookups: (namespace, name) -> (fetched_at, result)
+        self._search_cache = {}
+        # memo of found fighter stats: normalized name -> (fetched_at, stats)
+        self._stats_cache = {}
 
     def _convert_height(self, height_str):
         """Convert height string to cm"""
         if not height_str:
             return 180
-        
-        try:
-            height_str = str(height_str).strip()
-            
-            # Already in cm
-            if 'cm' in height_str.lower():
-                return int(height_str.lower().replace('cm', '').strip())
-            
-            # Convert from feet and inches
-            if 'ft' in height_str or "'" in height_str:
-                # Remove common formats: 6ft 2in, 6'2", 6' 2"
-                height_str = height_str.replace('ft', "'").replace('in', '"')
-                height_str = height_str.replace('"', '').strip()
-                
-                if "'" in height_str:
-                    parts = height_str.split("'")
-                    feet = int(parts[0].strip())
-                    inches = int(parts[1].strip()) if len(parts) > 1 and parts[1].strip() else 0
-                    return int((feet * 12 + inches) * 2.54)
-            
-            # Try to parse as direct number
-            return int(float(height_str))
-            
-        except Exception as e:
-            print(f"  Warning: Could not parse height '{height_str}': {e}")
-            return 180
+        return _parse_height(str(height_str))
     
     def _convert_weight(self, weight_str):
         """Convert weight string to lbs"""
         if not weight_str:
             return 160
-        
-        try:
-            weight_str = str(weight_str).strip()
-            
-            # Already in lbs
-            if 'lbs' in weight_str.lower() or 'lb' in weight_str.lower():
-                return int(weight_str.lower().replace('lbs', '').replace('lb', '').strip())
-            
-            # Convert from kg
-            if 'kg' in weight_str.lower():
-                kg = float(weight_str.lower().replace('kg', '').strip())
-                return int(kg * 2.20462)
-            
-            # Try to parse as direct number
-            return int(float(weight_str))
-            
-        except Exception as e:
-            print(f"  Warning: Could not parse weight '{weight_str}': {e}")
-            return 160
+        return _parse_weight(str(weight_str))
     
     def _estimate_reach(self, height_cm):
         """
@@ -518,16 +897,81 @@ class BoxingAPI:
         return height_cm
 
     def _find_local_fighter_key(self, fighter_name):
-        """Return the exact key from `fighter_db` matching `fighter_name` (case-insensitive), or None."""
+        """
+        Return the exact key from `fighter_db` matching `fighter_name`
+        (case-insensitive, or a nickname from FIGHTER_ALIASES), or None.
+        """
         if not fighter_name:
             return None
         lname = fighter_name.strip().lower()
-        for key in self.fighter_db:
-            if key.lower() == lname:
-                return key
-        return None
+        return self._db_index.get(lname) or FIGHTER_ALIASES.get(lname)
+
+    def _local_stats(self, local_key):
+        """Copy of the curated record for `local_key`, tagged with its name and source."""
+        stats = self.fighter_db[local_key].copy()
+        stats['name'] = local_key
+        stats['source'] = 'local_db'
+        return stats
+
+    def _cache_path(self, namespace, fighter_name):
+        """Return the on-disk cache file for `fighter_name` under `namespace`."""
+        key = hashlib.sha1((namespace + fighter_name).encode()).hexdigest()
+        return CACHE_DIR / f"{key}.json"
+
+    def _cached_lookup(self, namespace, fighter_name, fetch, key=None):
+        """
+        Return `fetch(fighter_name)`, reusing a result younger than CACHE_TTL
+        (in memory or under CACHE_DIR) cached for `namespace` and `key`
+        (default: the name itself). Only truthy results are cached, so a
+        failed or empty lookup is retried next time.
+        """
+        now = time.time()
+        key = fighter_name if key is None else key
+        memo_key = (namespace, key)
+        cached = self._search_cache.get(memo_key)
+        if cached and now - cached[0] < CACHE_TTL:
+            return cached[1]
+
+        cache_path = self._cache_path(namespace, key)
+        try:
+            mtime = cache_path.stat().st_mtime
+            if now - mtime < CACHE_TTL:
+                result = _json_loads(cache_path.read_bytes())
+                print(f"\n✓ Loaded cached API result for {fighter_name}")
+                self.last_search_debug[fighter_name] = self.last_search_debug.get(fighter_name, []) + [{
+                    'source': 'cache', 'path': str(cache_path)
+                }]
+                self._search_cache[memo_key] = (mtime, result)
+                return result
+        except (OSError, ValueError):
+            pass
+
+        result = fetch(fighter_name)
+        if result:
+            self._search_cache[memo_key] = (now, result)
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as fh:
+                    json.dump(result, fh)
+            except OSError as e:
+                print(f"  → Could not write API cache {cache_path}: {e}")
+        return result
 
     def search_fighter(self, fighter_name):
+        """
+        Search for fighter by name using TheSportsDB API, reusing a cached
+        player record (see `_cached_lookup`; keyed per API tier).
+        """
+        return self._cached_lookup(self.base_url, fighter_name, self._search_raw)
+
+    def _map_concurrent(self, func, fighter_names):
+        """Apply `func` to each distinct name on a thread pool, preserving order."""
+        unique = list(dict.fromkeys(fighter_names))
+        with ThreadPoolExecutor(max_workers=max(1, len(unique))) as executor:
+            found = dict(zip(unique, executor.map(func, unique)))
+        return [found[name] for name in fighter_names]
+
+    def _search_raw(self, fighter_name):
         """
         Search for fighter by name using TheSportsDB API (premium or free)
         Try multiple endpoint variants and report response keys for better
@@ -537,29 +981,18 @@ class BoxingAPI:
         try:
             params = {"p": fighter_name}
 
-            # Build candidate URLs to try (covers v1/v2 and presence/absence of key in path)
-            candidates = []
-            if self.is_premium:
-                candidates.append((f"{self.base_url}/searchplayers.php", True))
-                candidates.append((f"{self.base_url}/all/searchplayers.php", True))
-            else:
-                # v1: base_url already is https://www.thesportsdb.com/api/v1/json
-                candidates.append((f"{self.base_url}/{self.api_key}/searchplayers.php", False))
-                candidates.append((f"{self.base_url}/searchplayers.php", False))
+            candidates = self._search_candidates
 
-            for url, use_headers in candidates:
-                try:
-                    if use_headers:
-                        response = requests.get(url, headers=self.headers, params=params, timeout=10)
-                    else:
-                        response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                except requests.exceptions.RequestException as e:
-                    print(f"  → Request to {url} failed: {e}")
+            # Probe the candidates in order and stop at the first with players, so
+            # a hit on the first URL spends one request of the free-tier quota
+            for url in candidates:
+                response = self._get_candidate(url, params)
+                if isinstance(response, requests.exceptions.RequestException):
+                    print(f"  → Request to {url} failed: {response}")
                     continue
 
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                 except Exception as e:
                     print(f"  → Failed to decode JSON from {url}: {e}")
                     continue
@@ -590,7 +1023,26 @@ class BoxingAPI:
             print(f"→ Falling back to local database...")
             return None
 
+    def _get_candidate(self, url, params):
+        """GET one search endpoint; returns the response, or the RequestException raised."""
+        try:
+            # The session already carries the premium headers (none on the free tier)
+            response = self.session.get(url, params=params, timeout=(3, 10))
+            if response.status_code >= 400:
+                return requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+            return response
+        except requests.exceptions.RequestException as e:
+            return e
+
     def search_rapidapi_schedule(self, fighter_name):
+        """
+        `_search_rapidapi_schedule_raw`, cached like TheSportsDB searches
+        (names are matched case-insensitively, so the key is normalized).
+        """
+        return self._cached_lookup('rapidapi.schedule', fighter_name, self._search_rapidapi_schedule_raw,
+                                   key=fighter_name.strip().lower())
+
+    def _search_rapidapi_schedule_raw(self, fighter_name):
         """
         Search the RapidAPI boxing events schedule for a fighter name.
         This is used as a fallback when TheSportsDB returns no player info
@@ -598,42 +1050,40 @@ class BoxingAPI:
         Returns a small dict when matched, otherwise None.
         """
         print(f"\n🔎 Searching RapidAPI schedule for: {fighter_name}")
-        # Allow override via env var RAPIDAPI_KEY; fall back to a bundled key if not set
-        rapid_key = os.getenv('RAPIDAPI_KEY') or '954b586842msha9c5947f76e426bp13b543jsnd28cc99ca940'
         url = 'https://boxing-data-api.p.rapidapi.com/v1/events/schedule'
         params = {'days': 7, 'past_hours': 12, 'date_sort': 'ASC', 'page_num': 1, 'page_size': 25}
-        headers = {
-            'x-rapidapi-host': 'boxing-data-api.p.rapidapi.com',
-            'x-rapidapi-key': rapid_key
-        }
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            resp = self.rapid_session.get(url, params=params, timeout=10)
+            error = f"HTTP {resp.status_code}" if resp.status_code >= 400 else None
+            data = _json_loads(resp.content) if error is None else None
         except Exception as e:
-            print(f"  → RapidAPI schedule request failed: {e}")
+            error = str(e)
+        if error:
+            print(f"  → RapidAPI schedule request failed: {error}")
             # record debug and return None
             self.last_search_debug[fighter_name] = self.last_search_debug.get(fighter_name, []) + [{
-                'source': 'rapidapi.schedule', 'error': str(e)
+                'source': 'rapidapi.schedule', 'error': error
             }]
             return None
 
-        # Try to find the fighter name anywhere in the returned payload
-        def _find(obj):
-            if isinstance(obj, dict):
-                for v in obj.values():
-                    if _find(v):
-                        return True
-            elif isinstance(obj, list):
-                for it in obj:
-                    if _find(it):
-                        return True
-            elif isinstance(obj, str):
-                if fighter_name.lower() in obj.lower():
-                    return True
-            return False
-
-        matched = _find(data)
+        # Try to find the fighter name anywhere in the returned payload. One
+        # substring scan of the raw body rules out the common no-match case;
+        # only on a hit are the parsed string values walked (iteratively).
+        # The scan is only trusted for plain ASCII names: JSON may escape
+        # anything else (\u00e1, \", \/), so those always get the walk
+        needle = fighter_name.lower()
+        plain = needle.isascii() and needle.isprintable() and not set(needle) & set('"\\/')
+        matched = False
+        if not plain or needle in resp.text.lower():
+            stack = [data]
+            while stack and not matched:
+                obj = stack.pop()
+                if isinstance(obj, dict):
+                    stack.extend(obj.values())
+                elif isinstance(obj, list):
+                    stack.extend(obj)
+                elif isinstance(obj, str):
+                    matched = needle in obj.lower()
         self.last_search_debug[fighter_name] = self.last_search_debug.get(fighter_name, []) + [{
             'source': 'rapidapi.schedule', 'matched': bool(matched)
         }]
@@ -646,13 +1096,20 @@ class BoxingAPI:
         return None
 
     def search_rapidapi_fighter_details(self, fighter_name):
+        """
+        `_search_rapidapi_fighter_details_raw`, cached like TheSportsDB searches
+        (keyed on the normalized name).
+        """
+        return self._cached_lookup('rapidapi.fighter_details', fighter_name,
+                                   self._search_rapidapi_fighter_details_raw, key=fighter_name.strip().lower())
+
+    def _search_rapidapi_fighter_details_raw(self, fighter_name):
         """
         Query the Boxing Data API (via RapidAPI) for detailed fighter profiles.
         Try several candidate endpoints and parse the first reasonable result.
         Returns a dict of raw API fields or None.
         """
         print(f"\n🔎 Searching RapidAPI fighter details for: {fighter_name}")
-        rapid_key = os.getenv('RAPIDAPI_KEY') or '954b586842msha9c5947f76e426bp13b543jsnd28cc99ca940'
         base = 'https://boxing-data-api.p.rapidapi.com'
 
         # Candidate endpoints and param names to try
@@ -664,20 +1121,17 @@ class BoxingAPI:
             (f"{base}/v1/fighters/search", {'name': fighter_name}),
         ]
 
-        headers = {
-            'x-rapidapi-host': 'boxing-data-api.p.rapidapi.com',
-            'x-rapidapi-key': rapid_key
-        }
-
         for url, params in candidates:
             try:
-                resp = requests.get(url, headers=headers, params=params, timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
+                resp = self.rapid_session.get(url, params=params, timeout=10)
+                error = f"HTTP {resp.status_code}" if resp.status_code >= 400 else None
+                data = _json_loads(resp.content) if error is None else None
             except Exception as e:
+                error = str(e)
+            if error:
                 # record debug and continue
                 self.last_search_debug[fighter_name] = self.last_search_debug.get(fighter_name, []) + [{
-                    'source': 'rapidapi.fighter_details', 'url': url, 'error': str(e)
+                    'source': 'rapidapi.fighter_details', 'url': url, 'error': error
                 }]
                 continue
 
@@ -690,27 +1144,24 @@ class BoxingAPI:
             # Heuristics: look for lists under common keys
             candidates_keys = []
             if isinstance(data, dict):
-                for k in ('data', 'fighters', 'boxers', 'results', 'items'):
-                    v = data.get(k)
-                    if isinstance(v, list) and len(v) > 0:
-                        candidates_keys = v
-                        break
+                candidates_keys = next((v for v in map(data.get, _FIGHTER_LIST_KEYS)
+                                        if isinstance(v, list) and v), [])
 
                 # Or if top-level appears to be a single fighter dict
                 if not candidates_keys:
                     # sometimes API returns a single object with fighter fields
                     # check for presence of name-like keys
-                    if any(k in data for k in ('name', 'fighter_name', 'fullName', 'first_name')):
+                    if not _FIGHTER_NAME_KEYS.isdisjoint(data):
                         candidates_keys = [data]
 
             # If we found potential fighter records, pick the first and normalize
             if candidates_keys:
                 candidate = candidates_keys[0]
                 # Try to extract common fields
-                wins = int(candidate.get('wins', candidate.get('win', 0) or 0) or 0)
-                losses = int(candidate.get('losses', candidate.get('loss', 0) or 0) or 0)
-                draws = int(candidate.get('draws', candidate.get('ties', 0) or 0) or 0)
-                ko_wins = int(candidate.get('ko', candidate.get('kos', candidate.get('ko_wins', 0) or 0) or 0) or 0)
+                wins = _coerce_int(candidate, ('wins', 'win'))
+                losses = _coerce_int(candidate, ('losses', 'loss'))
+                draws = _coerce_int(candidate, ('draws', 'ties'))
+                ko_wins = _coerce_int(candidate, ('ko', 'kos', 'ko_wins'))
 
                 # Height and weight may be in various units/keys
                 height = candidate.get('height') or candidate.get('height_cm') or candidate.get('height_cm_display') or None
@@ -758,10 +1209,36 @@ class BoxingAPI:
         return None
     
     def get_fighter_stats(self, fighter_name):
+        """
+        Fetch fighter statistics from API or local database (see
+        `_fetch_fighter_stats`). Found records are memoized per instance on the
+        normalized name for CACHE_TTL; callers get a copy, so mutating it can't
+        poison the cache.
+        """
+        now = time.time()
+        key = fighter_name.strip().lower()
+        cached = self._stats_cache.get(key)
+        if cached and now - cached[0] < CACHE_TTL:
+            return dict(cached[1])
+        stats = self._fetch_fighter_stats(fighter_name)
+        if not stats:
+            return None
+        self._stats_cache[key] = (now, stats)
+        return dict(stats)
+
+    def _fetch_fighter_stats(self, fighter_name):
         """
         Fetch fighter statistics from API or local database
+        Fighters in the curated local DB (any case, or a known nickname) are
+        served from it without a network round trip unless the local DB is disabled.
         """
-        # Try API first
+        if self.use_local_fallback:
+            local_key = self._find_local_fighter_key(fighter_name)
+            if local_key:
+                print(f"\n✓ Using curated local DB record for {local_key}")
+                return self._local_stats(local_key)
+
+        # Otherwise try the API
         player_data = self.search_fighter(fighter_name)
         
         if player_data:
@@ -790,23 +1267,10 @@ class BoxingAPI:
                     # If the API returns no bout records but we have a curated
                     # local entry for this fighter, prefer the curated record
                     # because it will be more accurate for well-known fighters.
-                    local_key = self._find_local_fighter_key(fighter_name)
+                    local_key = self.use_local_fallback and self._find_local_fighter_key(fighter_name)
                     if local_key:
                         print("⚠ API returned no bout records. Using local curated DB for this fighter.")
-                        stats = self.fighter_db[local_key].copy()
-                        stats['name'] = local_key
-                        stats['source'] = 'local_db'
-                        return stats
-
-                    use_local_fallback = os.getenv('USE_LOCAL_DB_FALLBACK', 'true').lower() in ('1', 'true', 'yes')
-                    if use_local_fallback:
-                        local_key = self._find_local_fighter_key(fighter_name)
-                        if local_key:
-                            print("⚠ API returned no bout records. Using local DB fallback for this fighter.")
-                            stats = self.fighter_db[local_key].copy()
-                            stats['name'] = local_key
-                            stats['source'] = 'local_db'
-                            return stats
+                        return self._local_stats(local_key)
 
                     # If the API provides a player entry but zero bout counts,
                     # try the RapidAPI schedule as a fallback before using
@@ -814,18 +1278,7 @@ class BoxingAPI:
                     # contains a player stub but no bout history.
                     schedule_match = self.search_rapidapi_schedule(fighter_name)
                     if schedule_match:
-                        stats = {
-                            'name': fighter_name,
-                            'wins': 1,
-                            'losses': 0,
-                            'draws': 0,
-                            'total_bouts': 1,
-                            'ko_wins': 0,
-                            'height': 180,
-                            'reach': 180,
-                            'weight': 170,
-                            'source': 'rapidapi.schedule'
-                        }
+                        stats = dict(_SCHEDULE_DEFAULT_STATS, name=fighter_name)
                         print(f"✓ Created minimal stats for '{fighter_name}' from RapidAPI schedule fallback.")
                         return stats
 
@@ -860,7 +1313,9 @@ class BoxingAPI:
         # No structured API player data. Try RapidAPI schedule to detect
         # recently announced or card-listed fighters (minimal safe defaults).
         # First, try fetching richer fighter details from the Boxing Data API
-        # (RapidAPI) before falling back to schedule or curated DB.
+        # (RapidAPI) before falling back to schedule or curated DB. The schedule
+        # is only fetched when the details lookup misses, so a hit costs one
+        # RapidAPI request against the quota, not two.
         details = self.search_rapidapi_fighter_details(fighter_name)
         if details:
             return details
@@ -869,150 +1324,264 @@ class BoxingAPI:
         if schedule_match:
             # Use conservative safe defaults so simulations can run without
             # halting for missing curated data. These defaults avoid divide-by-zero.
-            stats = {
-                'name': fighter_name,
-                'wins': 1,
-                'losses': 0,
-                'draws': 0,
-                'total_bouts': 1,
-                'ko_wins': 0,
-                'height': 180,
-                'reach': 180,
-                'weight': 170,
-                'source': 'rapidapi.schedule'
-            }
+            stats = dict(_SCHEDULE_DEFAULT_STATS, name=fighter_name)
             print(f"✓ Created minimal stats for '{fighter_name}' from RapidAPI schedule fallback.")
             return stats
 
-        # If RapidAPI schedule didn't find the fighter, optionally fall back
-        # to the curated local DB only when explicitly allowed via env var.
-        use_local_fallback = os.getenv('USE_LOCAL_DB_FALLBACK', 'true').lower() in ('1', 'true', 'yes')
-        if use_local_fallback and fighter_name in self.fighter_db:
-            print(f"⚠ No API data for '{fighter_name}'; using local DB fallback.")
-            stats = self.fighter_db[fighter_name].copy()
-            stats['name'] = fighter_name
-            stats['source'] = 'local_db'
-            return stats
-
         print(f"✗ Fighter '{fighter_name}' not found in API, RapidAPI schedule, or allowed local DB fallback.")
         return None
     
-    def create_dataframe(self, fighter_name):
+    def get_fighters_stats(self, fighter_names):
         """
-        Create a pandas DataFrame with fighter statistics
+        `get_fighter_stats` for several fighters, looked up concurrently.
+        Repeated names are fetched once; results follow `fighter_names`.
+        """
+        return self._map_concurrent(self.get_fighter_stats, fighter_names)
+
+    def create_fighter_stats(self, fighter_name):
+        """
+        Fetch fighter statistics as a `FighterStats`, or None if not found
         """
         stats = self.get_fighter_stats(fighter_name)
-        if stats:
-            df = pd.DataFrame([stats])
-            df['win_rate'] = df['wins'] / df['total_bouts']
-            df['ko_rate'] = df['ko_wins'] / df['total_bouts']
-            return df
-        return None
+        return FighterStats.from_stats(stats) if stats else None
 
+    def create_fighters(self, fighter_names):
+        """
+        `create_fighter_stats` for several fighters, looked up concurrently
+        (the lookups are network-bound). Repeated names are fetched once.
+        """
+        return self._map_concurrent(self.create_fighter_stats, fighter_names)
 
-def simulate_batch(batch_size, f1_stats, f2_stats, std_f1_win, std_f2_win, 
-                   std_f1_ko, std_f2_ko, fighter1_win, fighter2_win, 
-                   ko_fighter1, ko_fighter2):
+
+def _score_diff_model(f1_stats, f2_stats, std_f1_win, std_f2_win, std_f1_ko, std_f2_ko,
+                      fighter1_win, fighter2_win, ko_fighter1, ko_fighter2):
     """
-    Simulate a batch of fights for parallel processing
-    Accounts for: win rate, KO power, physical attributes (height/reach), and weight class
+    Reduce the scoring model to score1 - score2 = offset + coef . z with z ~ N(0, I6).
+    Each fighter's win rate, KO rate, height, reach, weight and fight-noise samples are
+    independent normals that only enter the score difference as pairwise differences,
+    and the difference of two independent normals is normal with the summed variance.
+    So 6 draws per fight replace 12, with the same outcome distribution.
     """
-    fighter1_wins = 0
-    fighter2_wins = 0
-    draws = 0
-    
     # Weight class advantage calculation
     # Heavier fighters have inherent advantage in strength/power
     f1_weight = f1_stats.get('weight', 170)
     f2_weight = f2_stats.get('weight', 170)
-    weight_diff = abs(f2_weight - f1_weight)  # How different their weights are
-    
-    for _ in range(batch_size):
-        # Sample win rates with variance
-        f1_win_sample = np.random.normal(fighter1_win, std_f1_win)
-        f2_win_sample = np.random.normal(fighter2_win, std_f2_win)
-        
-        # Sample KO rates with variance
-        f1_ko_sample = np.random.normal(ko_fighter1, std_f1_ko)
-        f2_ko_sample = np.random.normal(ko_fighter2, std_f2_ko)
-        
-        # Sample physical attributes with variance
-        f1_height_sample = np.random.normal(f1_stats['height'], std_height)
-        f2_height_sample = np.random.normal(f2_stats['height'], std_height)
-        f1_reach_sample = np.random.normal(f1_stats['reach'], std_reach)
-        f2_reach_sample = np.random.normal(f2_stats['reach'], std_reach)
-        
-        # Sample weight with variance (fighters naturally vary ±5 lbs)
-        f1_weight_sample = np.random.normal(f1_weight, 5)
-        f2_weight_sample = np.random.normal(f2_weight, 5)
-        
-        # Calculate advantages
-        height_advantage = (f1_height_sample - f2_height_sample) / 200
-        reach_advantage = (f1_reach_sample - f2_reach_sample) / 200
-        
-        # Weight class advantage: massive factor in boxing across different weight classes
-        # Heavier fighters have more power, durability, and reach advantage
-        # Formula: (fighter1_weight - fighter2_weight) / 460 (optimized for 90/10 split)
-        weight_advantage = (f1_weight_sample - f2_weight_sample) / 460
-        
-        # Calculate fight scores with weighted factors accounting for weight class
-        # Major focus on weight advantage in cross-weight-class matchups
-        fighter1_score = (
-            f1_win_sample * 0.37 +      # Historical win rate (37%)
-            f1_ko_sample * 0.15 +        # KO power (15%)
-            height_advantage * 0.08 +   # Height advantage (8%)
-            reach_advantage * 0.05 +    # Reach advantage (5%)
-            weight_advantage * 0.35     # Weight class advantage (35%, reduced from 50%)
-        )
-        
-        fighter2_score = (
-            f2_win_sample * 0.37 +
-            f2_ko_sample * 0.15 -
-            height_advantage * 0.08 -
-            reach_advantage * 0.05 -
-            weight_advantage * 0.35
-        )
-        
-        # Add random variance to simulate fight unpredictability
-        fighter1_score += np.random.normal(0, 0.1)
-        fighter2_score += np.random.normal(0, 0.1)
-        
-        # Determine winner (reduced draw threshold from 0.05 to 0.02 for more decisive outcomes)
-        if abs(fighter1_score - fighter2_score) < 0.02:
-            draws += 1
-        elif fighter1_score > fighter2_score:
-            fighter1_wins += 1
+
+    # Mean and standard deviation of each difference; fighters naturally vary ±5 lbs
+    means = np.array([fighter1_win - fighter2_win, ko_fighter1 - ko_fighter2,
+                      f1_stats['height'] - f2_stats['height'], f1_stats['reach'] - f2_stats['reach'],
+                      f1_weight - f2_weight, 0.0], dtype=np.float64)
+    sigmas = np.array([np.hypot(std_f1_win, std_f2_win), np.hypot(std_f1_ko, std_f2_ko),
+                       std_height * SQRT_2, std_reach * SQRT_2, 5 * SQRT_2, NOISE_SIGMA * SQRT_2],
+                      dtype=np.float64)
+    return float(DIFF_WEIGHTS @ means), DIFF_WEIGHTS * sigmas
+
+
+def simulate_batch(batch_size, f1_stats, f2_stats, std_f1_win, std_f2_win, 
+                   std_f1_ko, std_f2_ko, fighter1_win, fighter2_win, 
+                   ko_fighter1, ko_fighter2, seed=None, count_draws=True, tile_size=None):
+    """
+    Simulate a batch of fights for parallel processing
+    Accounts for: win rate, KO power, physical attributes (height/reach), and weight class
+    Fights are scored with vectorized NumPy arithmetic in tiles of `tile_size` fights
+    (default SIM_TILE), reusing the same preallocated buffers for every tile so memory
+    stays flat for large batches. Seeded counts are reproducible for a given tile size.
+    Each fight's score difference is drawn directly (see `_score_diff_model`).
+    `seed` (an int or a spawned SeedSequence) seeds this batch's own PCG64DXSM Generator.
+    With `count_draws=False` there is no draw bucket: every fight goes to whoever
+    scores higher (an exact tie goes to fighter 2, as in the original model), so
+    draws is always 0.
+    """
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    offset, coef = _score_diff_model(f1_stats, f2_stats, std_f1_win, std_f2_win, std_f1_ko, std_f2_ko,
+                                     fighter1_win, fighter2_win, ko_fighter1, ko_fighter2)
+    coef = coef.astype(np.float32)
+
+    # Scratch buffers shared by every tile. Everything is float32: results are
+    # percentages, so float64 only doubles the memory traffic.
+    tile = max(1, min(tile_size or SIM_TILE, batch_size))
+    z_buf = np.empty(coef.size * tile, dtype=np.float32)
+    diff_buf = np.empty(tile, dtype=np.float32)
+
+    counts = np.zeros(3, dtype=np.int64)
+    for start in range(0, batch_size, tile):
+        n = min(tile, batch_size - start)
+
+        # Draw one (6, n) standard-normal block and combine it into score differences
+        z = z_buf[:coef.size * n].reshape(coef.size, n)
+        rng.standard_normal(dtype=np.float32, out=z)
+        diff = diff_buf[:n]
+        np.dot(coef, z, out=diff)
+        diff += offset
+
+        # Determine winners (reduced draw threshold from 0.05 to 0.02 for more decisive outcomes):
+        # class 0 = fighter 2 wins, 1 = draw, 2 = fighter 1 wins, tallied in one bincount
+        if count_draws:
+            outcome = np.add(diff > -DRAW_THRESHOLD, diff >= DRAW_THRESHOLD, dtype=np.intp)
         else:
-            fighter2_wins += 1
+            # Two classes only; fighter 1 wins land in the same slot as above
+            outcome = (diff > 0).view(np.uint8) * np.uint8(2)
+        counts += np.bincount(outcome, minlength=3)
+
+    fighter2_wins, draws, fighter1_wins = (int(c) for c in counts)
     
     return (fighter1_wins, fighter2_wins, draws)
 
 
-def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multiprocessing=True):
+# Numba's default workqueue threading layer aborts the process when two threads
+# enter a parallel kernel at once, so kernel calls from concurrent requests (or
+# test threads) take turns; each call already uses every Numba thread
+_KERNEL_LOCK = threading.Lock()
+
+
+if NUMBA_AVAILABLE:
+    # boundscheck=False pins the no-bounds-check build even if NUMBA_BOUNDSCHECK
+    # is set globally; all indices are derived from batch_size and KERNEL_CHUNK.
+    # nogil=True lets other Python threads (e.g. web requests doing lookups) run
+    # meanwhile; calls themselves are serialized by _KERNEL_LOCK
+    @njit(parallel=True, fastmath=True, boundscheck=False, nogil=True, cache=True)
+    def _simulate_kernel(batch_size, offset, coef, chunk_seeds, count_draws):
+        """
+        Numba-compiled scalar version of `simulate_batch` (same score-difference model).
+        Fights are split into KERNEL_CHUNK-sized chunks spread over threads with prange;
+        each chunk reseeds its thread's generator from `chunk_seeds`, so the counts
+        don't depend on how chunks are scheduled. A chunk draws all of its standard
+        normals into one (n, 6) buffer up front, so the scoring loop is pure
+        multiply-adds. Numba's generator only produces float64, so each normal is
+        narrowed to float32 as it is read (no second float32 copy of the buffer)
+        and the scoring runs in float32 like `simulate_batch`.
+        """
+        n_chunks = chunk_seeds.shape[0]
+        counts = np.zeros((n_chunks, 3), dtype=np.int64)
+        c0, c1, c2, c3, c4, c5 = coef[0], coef[1], coef[2], coef[3], coef[4], coef[5]
+        for c in prange(n_chunks):
+            np.random.seed(chunk_seeds[c])
+            start = c * KERNEL_CHUNK
+            end = min(start + KERNEL_CHUNK, batch_size)
+            z = np.random.standard_normal((end - start, 6))
+            f1_wins = 0
+            f2_wins = 0
+            draws = 0
+            for i in range(end - start):
+                diff = (offset + c0 * np.float32(z[i, 0]) + c1 * np.float32(z[i, 1]) +
+                        c2 * np.float32(z[i, 2]) + c3 * np.float32(z[i, 3]) +
+                        c4 * np.float32(z[i, 4]) + c5 * np.float32(z[i, 5]))
+                if count_draws and abs(diff) < DRAW_THRESHOLD:
+                    draws += 1
+                elif diff > 0:
+                    f1_wins += 1
+                else:
+                    f2_wins += 1
+            counts[c, 0] = f1_wins
+            counts[c, 1] = f2_wins
+            counts[c, 2] = draws
+        return counts[:, 0].sum(), counts[:, 1].sum(), counts[:, 2].sum()
+
+
+def run_simulation_kernel(batch_size, f1_stats, f2_stats, std_f1_win, std_f2_win,
+                          std_f1_ko, std_f2_ko, fighter1_win, fighter2_win,
+                          ko_fighter1, ko_fighter2, seed=None, count_draws=True):
+    """
+    Run a batch through the Numba kernel (same arguments as `simulate_batch`).
+    Threading is handled by Numba, so one call covers the whole batch.
+    """
+    n_chunks = max(1, -(-batch_size // KERNEL_CHUNK))
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    chunk_seeds = seed_seq.generate_state(n_chunks)
+    offset, coef = _score_diff_model(f1_stats, f2_stats, std_f1_win, std_f2_win, std_f1_ko, std_f2_ko,
+                                     fighter1_win, fighter2_win, ko_fighter1, ko_fighter2)
+    # float32 scoring, matching the float32 normals used inside the kernel
+    with _KERNEL_LOCK:
+        f1_wins, f2_wins, draws = _simulate_kernel(batch_size, np.float32(offset), coef.astype(np.float32),
+                                                   chunk_seeds, count_draws)
+    return (int(f1_wins), int(f2_wins), int(draws))
+
+
+def warmup_kernel():
+    """
+    Compile the Numba kernel (or load it from Numba's on-disk cache) with a 2-fight
+    run, so the first real simulation isn't charged for it. No-op without Numba.
+    """
+    if NUMBA_AVAILABLE:
+        with _KERNEL_LOCK:
+            _simulate_kernel(2, np.float32(0.0), np.zeros(6, dtype=np.float32),
+                             np.zeros(1, dtype=np.uint32), True)
+
+
+# Process-wide simulation pool, started on first use and reused by every
+# monte_carlo_simulation call (and the web app) instead of one Pool per call
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _shared_pool():
+    """Return the shared simulation Pool, starting it on the first call."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = Pool(cpu_count())
+            atexit.register(_POOL.terminate)
+    return _POOL
+
+
+def _simulate_task(batch_size, seed, params, count_draws):
+    """Run one batch in a shared Pool worker; the parameters travel with the task."""
+    return simulate_batch(batch_size, *params, seed=seed, count_draws=count_draws)
+
+
+def _stats_dict(fighter):
+    """Return a plain stats dict from a FighterStats, a stats dict or a one-row DataFrame."""
+    if isinstance(fighter, FighterStats):
+        return fighter.to_dict()
+    if isinstance(fighter, dict):
+        return dict(fighter)
+    return fighter.iloc[0].to_dict()
+
+
+@lru_cache(maxsize=128)
+def _record_rates(wins, ko_wins, total_bouts):
+    """
+    Return (win_rate, std_win, ko_rate, std_ko) for a fight record; the
+    standard deviations are binomial, over total_bouts.
+    """
+    win_rate = wins / total_bouts
+    std_win = np.sqrt(win_rate * (1 - win_rate) / total_bouts)
+    # KO rate over total_bouts (FIXED: not wins) to account for sample size;
+    # this prevents bias where fighters with few fights are over/underestimated
+    ko_rate = ko_wins / total_bouts if total_bouts > 0 else 0
+    std_ko = np.sqrt(ko_rate * (1 - ko_rate) / total_bouts) if total_bouts > 0 else 0
+    return win_rate, std_win, ko_rate, std_ko
+
+
+def _ci_half_width(wins, n):
+    """Half-width of the 99% normal-approximation interval for a win rate of wins/n."""
+    p = wins / n
+    return CI_Z_99 * np.sqrt(p * (1 - p) / n)
+
+
+def monte_carlo_simulation(fighter1, fighter2, n_simulations=N, use_multiprocessing=True, seed=SEED,
+                           count_draws=True, tolerance=None, pool=None):
     """
     Run Monte Carlo simulation to predict fight outcomes with optional multiprocessing
+    Fighters may be given as FighterStats, stats dicts or one-row DataFrames.
+    Each batch gets an independent random stream spawned from SeedSequence(seed).
+    `count_draws=False` drops the draw bucket (see `simulate_batch`).
+    With a `tolerance` (e.g. 0.005), fights are run in chunks of EARLY_STOP_CHUNK and
+    the run stops once the 99% interval half-width of both win rates is below it;
+    `n_simulations` is then an upper bound and the result reports the count run.
+    The Pool path runs on `pool` if given, else on the process-wide pool from
+    `_shared_pool()`, so repeated calls don't pay for a new Pool each time.
     """
     
     # Extract fighter statistics
-    f1_stats = fighter1_df.iloc[0].to_dict()
-    f2_stats = fighter2_df.iloc[0].to_dict()
+    f1_stats = _stats_dict(fighter1)
+    f2_stats = _stats_dict(fighter2)
     
-    # Calculate win rates
-    fighter1_win = f1_stats['wins'] / f1_stats['total_bouts']
-    fighter2_win = f2_stats['wins'] / f2_stats['total_bouts']
-    
-    # Calculate standard deviations for win rates (using binomial distribution)
-    std_fighter1_win = np.sqrt(fighter1_win * (1 - fighter1_win) / f1_stats['total_bouts'])
-    std_fighter2_win = np.sqrt(fighter2_win * (1 - fighter2_win) / f2_stats['total_bouts'])
-    
-    # Calculate KO rates (FIXED: using total_bouts instead of wins to account for sample size)
-    # This prevents bias where fighters with few fights are over/underestimated
-    ko_fighter1 = f1_stats['ko_wins'] / f1_stats['total_bouts'] if f1_stats['total_bouts'] > 0 else 0
-    ko_fighter2 = f2_stats['ko_wins'] / f2_stats['total_bouts'] if f2_stats['total_bouts'] > 0 else 0
-    
-    # Calculate standard deviations for KO rates (using total_bouts for more accurate confidence intervals)
-    std_fighter1_ko = np.sqrt(ko_fighter1 * (1 - ko_fighter1) / f1_stats['total_bouts']) if f1_stats['total_bouts'] > 0 else 0
-    std_fighter2_ko = np.sqrt(ko_fighter2 * (1 - ko_fighter2) / f2_stats['total_bouts']) if f2_stats['total_bouts'] > 0 else 0
+    # Win/KO rates and their binomial standard deviations (memoized per record)
+    fighter1_win, std_fighter1_win, ko_fighter1, std_fighter1_ko = _record_rates(
+        f1_stats['wins'], f1_stats['ko_wins'], f1_stats['total_bouts'])
+    fighter2_win, std_fighter2_win, ko_fighter2, std_fighter2_ko = _record_rates(
+        f2_stats['wins'], f2_stats['ko_wins'], f2_stats['total_bouts'])
     
     print(f"\n{'='*60}")
     print(f"MONTE CARLO BOXING SIMULATION")
@@ -1049,8 +1618,62 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
     print(f"{'='*60}\n")
     
     start_time = time.time()
+
+    seed_seq = np.random.SeedSequence(seed)
     
-    if use_multiprocessing:
+    if tolerance is not None:
+        # Early stopping: chunks run in-process (each is too small to be worth a Pool),
+        # each with its own spawned stream, until both win rates have converged
+        batch_args = (f1_stats, f2_stats, std_fighter1_win, std_fighter2_win,
+                      std_fighter1_ko, std_fighter2_ko, fighter1_win, fighter2_win,
+                      ko_fighter1, ko_fighter2)
+        if NUMBA_AVAILABLE:
+            set_num_threads(numba_config.NUMBA_NUM_THREADS if use_multiprocessing else 1)
+            run_chunk = run_simulation_kernel
+        else:
+            run_chunk = simulate_batch
+        print(f"Running up to {n_simulations:,} simulations in chunks of {EARLY_STOP_CHUNK:,} "
+              f"(stopping at ±{tolerance:.2%} at 99% confidence)...\n")
+        fighter1_wins = fighter2_wins = draws = 0
+        completed = 0
+        while completed < n_simulations:
+            size = min(EARLY_STOP_CHUNK, n_simulations - completed)
+            w1, w2, d = run_chunk(size, *batch_args, seed=seed_seq.spawn(1)[0], count_draws=count_draws)
+            fighter1_wins += w1
+            fighter2_wins += w2
+            draws += d
+            completed += size
+            if max(_ci_half_width(fighter1_wins, completed),
+                   _ci_half_width(fighter2_wins, completed)) < tolerance:
+                break
+        if completed < n_simulations:
+            print(f"✓ Converged after {completed:,} of {n_simulations:,} simulations")
+        n_simulations = completed
+
+    elif NUMBA_AVAILABLE:
+        # Numba threads replace the Pool: one in-process call, no pickling or fork.
+        # Without multiprocessing the kernel is pinned to a single thread.
+        num_threads = numba_config.NUMBA_NUM_THREADS if use_multiprocessing else 1
+        set_num_threads(num_threads)
+        print(f"Running {n_simulations:,} simulations with the Numba JIT kernel ({num_threads} thread{'s' if num_threads > 1 else ''})...\n")
+        fighter1_wins, fighter2_wins, draws = run_simulation_kernel(
+            n_simulations,
+            f1_stats,
+            f2_stats,
+            std_fighter1_win,
+            std_fighter2_win,
+            std_fighter1_ko,
+            std_fighter2_ko,
+            fighter1_win,
+            fighter2_win,
+            ko_fighter1,
+            ko_fighter2,
+            seed_seq,
+            count_draws
+        )
+
+    elif use_multiprocessing and (n_simulations >= POOL_MIN_SIMULATIONS
+                                  and n_simulations / cpu_count() >= POOL_MIN_PER_CORE):
         # Use multiprocessing for faster computation
         num_cores = min(cpu_count(), n_simulations)
 
@@ -1062,9 +1685,11 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
         print(f"Running {n_simulations:,} simulations across {num_cores} cores...")
         print(f"Batch sizes per core: {[f'{b:,}' for b in batch_sizes]}\n")
 
-        # Prepare argument tuples for starmap
-        args = [(
-            batch_sizes[i],
+        # One independent child stream per worker so forked workers don't share RNG state
+        child_seeds = seed_seq.spawn(num_cores)
+
+        # Fighter parameters shared by every batch
+        worker_params = (
             f1_stats,
             f2_stats,
             std_fighter1_win,
@@ -1075,11 +1700,15 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
             fighter2_win,
             ko_fighter1,
             ko_fighter2
-        ) for i in range(num_cores)]
+        )
+        args = list(zip(batch_sizes, child_seeds))
 
-        # Run simulations in parallel using starmap
-        with Pool(num_cores) as pool:
-            results_list = pool.starmap(simulate_batch, args)
+        # Run simulations in parallel using starmap; the pool is long-lived and
+        # has no per-call initializer, so each task carries the (small) parameters
+        if pool is None:
+            pool = _shared_pool()
+        results_list = pool.starmap(_simulate_task, [(size, child, worker_params, count_draws)
+                                                     for size, child in args])
 
         # Aggregate results
         fighter1_wins = sum(r[0] for r in results_list)
@@ -1088,6 +1717,8 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
         
     else:
         # Single-threaded execution
+        if use_multiprocessing:
+            print("Skipping Pool: overhead exceeds work")
         print(f"Running {n_simulations:,} simulations (single-threaded)...\n")
         fighter1_wins, fighter2_wins, draws = simulate_batch(
             n_simulations,
@@ -1100,7 +1731,9 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
             fighter1_win,
             fighter2_win,
             ko_fighter1,
-            ko_fighter2
+            ko_fighter2,
+            seed_seq,
+            count_draws
         )
     
     end_time = time.time()
@@ -1128,6 +1761,7 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
         print(f"   Results are influenced by physical class advantage, not just skill\n")
     
     results = {
+        'n_simulations': n_simulations,
         'fighter1_wins': fighter1_wins,
         'fighter2_wins': fighter2_wins,
         'draws': draws,
@@ -1141,13 +1775,41 @@ def monte_carlo_simulation(fighter1_df, fighter2_df, n_simulations=N, use_multip
     return results
 
 
-def plot_results(results, fighter1_name, fighter2_name):
+# Reusable matplotlib (figure, axes) pairs, keyed by plot type
+_FIG_CACHE = {}
+
+
+def _build_results_figure(kind, figsize):
+    """
+    Return the off-screen (fig, ax) pair cached in _FIG_CACHE for chart `kind`,
+    with its axes cleared; the figure is only created (with the Agg backend,
+    so no GUI is initialized) on the first call for that kind.
+    """
+    # matplotlib is only imported when a plot is actually requested
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    if kind in _FIG_CACHE:
+        fig, ax = _FIG_CACHE[kind]
+        ax.cla()
+    else:
+        fig, ax = plt.subplots(figsize=figsize)
+        _FIG_CACHE[kind] = (fig, ax)
+    return fig, ax
+
+
+def plot_results(results, fighter1_name, fighter2_name, filepath='outcome.png'):
     """
     Plot Monte Carlo simulation results using matplotlib
     Creates a bar chart similar to the image provided
+    The chart is rendered off-screen and saved to `filepath` (returned) instead of
+    opening a blocking GUI window. The figure is kept in _FIG_CACHE and redrawn
+    on later calls rather than rebuilt.
     """
-    # Create figure
-    fig, ax = plt.subplots(figsize=(12, 7))
+    from matplotlib.ticker import FuncFormatter
+
+    fig, ax = _build_results_figure('results', (12, 7))
     
     # Data for plotting
     fighters = [fighter1_name, fighter2_name]
@@ -1179,30 +1841,47 @@ def plot_results(results, fighter1_name, fighter2_name):
     ax.set_facecolor('#F5F5F5')
     fig.patch.set_facecolor('white')
     
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    fig.savefig(filepath, dpi=110, bbox_inches='tight')
     
-    return fig
+    return filepath
+
+
+_SVG_TEMPLATE = """<svg xmlns="http://www.w3.org/2000/svg" width="800" height="500" viewBox="0 0 800 500" font-family="sans-serif">
+<rect width="800" height="500" fill="white"/>
+<text x="400" y="36" font-size="20" text-anchor="middle">Monte Carlo Simulation Results</text>
+<line x1="80" y1="440" x2="760" y2="440" stroke="black"/>
+{bars}
+</svg>
+"""
+_SVG_BAR = """<rect x="{x}" y="{y:.1f}" width="160" height="{h:.1f}" fill="{color}"/>
+<text x="{cx}" y="{ty:.1f}" font-size="14" text-anchor="middle">{value:,}</text>
+<text x="{cx}" y="464" font-size="14" text-anchor="middle">{label}</text>"""
 
 
-def save_plot_png(results, fighter1_name, fighter2_name, filepath):
-    """Save a simple matplotlib bar chart of the results to `filepath`."""
-    fig, ax = plt.subplots(figsize=(8, 5))
+def save_plot_svg(results, fighter1_name, fighter2_name, filepath):
+    """
+    Write a three-bar chart of the results (wins for each fighter, draws) as an SVG to `filepath`.
+    The layout is fixed, so this is plain string formatting with no matplotlib.
+    """
+    from html import escape
     labels = [fighter1_name, fighter2_name, 'Draws']
-    values = [results['fighter1_wins'], results['fighter2_wins'], results['draws']]
+    values = [int(results['fighter1_wins']), int(results['fighter2_wins']), int(results['draws'])]
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-    bars = ax.bar(labels, values, color=colors)
-    ax.set_ylabel('Wins')
-    ax.set_title('Monte Carlo Simulation Results')
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    for bar in bars:
-        h = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., h, f"{int(h):,}", ha='center', va='bottom')
-    fig.tight_layout()
-    # Ensure directory exists
+    top = max(values) or 1
+    bars = []
+    for i, (label, value, color) in enumerate(zip(labels, values, colors)):
+        h = 360 * value / top
+        x = 110 + i * 220
+        bars.append(_SVG_BAR.format(x=x, y=440 - h, h=h, color=color, cx=x + 80,
+                                    ty=432 - h, value=value, label=escape(str(label))))
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    fig.savefig(filepath)
-    plt.close(fig)
+    # Write to a temp file and rename it into place, so a concurrent reader
+    # never sees a half-written chart
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        fh.write(_SVG_TEMPLATE.format(bars='\n'.join(bars)))
+    os.replace(tmp_path, filepath)
 
 
 def print_results(results, fighter1_name, fighter2_name):
@@ -1252,10 +1931,32 @@ def print_results(results, fighter1_name, fighter2_name):
     print(f"{'='*60}\n")
 
 
-def main():
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return n
+
+
+def main(argv=None):
     """
     Main function to run the boxing Monte Carlo simulation
+    Fighters and options can be passed as flags for scripted/benchmark runs; the
+    interactive prompts are only shown when none are given and stdin is a terminal.
     """
+    parser = argparse.ArgumentParser(description="Boxing Monte Carlo fight prediction (CLI)")
+    parser.add_argument('--fighter1', help="Fighter 1 name (default: Anthony Joshua)")
+    parser.add_argument('--fighter2', help="Fighter 2 name (default: Jake Paul)")
+    parser.add_argument('--n', type=_positive_int, default=N, help=f"Number of simulations (default: {N:,})")
+    parser.add_argument('--no-mp', action='store_true', help="Disable multiprocessing")
+    parser.add_argument('--no-plot', action='store_true', help="Skip the results chart")
+    args = parser.parse_args(argv)
+    interactive = args.fighter1 is None and args.fighter2 is None and sys.stdin.isatty()
+
     print("\n" + "="*60)
     print("🥊 BOXING MONTE CARLO PREDICTION SYSTEM 🥊")
     print("Powered by TheSportsDB API")
@@ -1275,71 +1976,95 @@ def main():
     api = BoxingAPI(api_key=api_key)
     
     # Get available fighters
-    available_fighters = list(api.fighter_db.keys())
+    available_fighters = api._fighter_names
     print("\n📋 Available fighters in local database:")
     for i, fighter in enumerate(available_fighters, 1):
         print(f"  {i}. {fighter}")
     
     print("\n💡 Tip: You can search for ANY fighter by name!")
-    print("   The API will search TheSportsDB database first.")
-    
-    # Get fighter names from user
-    print("\n" + "-"*60)
-    print("Enter fighter names (or press Enter for default matchup)")
-    print("-"*60)
-    fighter1_name = input("Fighter 1 [Anthony Joshua]: ").strip() or "Anthony Joshua"
-    fighter2_name = input("Fighter 2 [Jake Paul]: ").strip() or "Jake Paul"
+    print("   Fighters listed above (or a known nickname, e.g. 'AJ') use the local database;")
+    print("   other names are searched on TheSportsDB first, then RapidAPI.")
     
-    # Ask about multiprocessing
-    use_mp = input("\nUse multiprocessing for faster simulation? [Y/n]: ").strip().lower()
-    use_multiprocessing = use_mp != 'n'
+    if interactive:
+        # Get fighter names from user
+        print("\n" + "-"*60)
+        print("Enter fighter names (or press Enter for default matchup)")
+        print("-"*60)
+        fighter1_name = input("Fighter 1 [Anthony Joshua]: ").strip() or "Anthony Joshua"
+        fighter2_name = input("Fighter 2 [Jake Paul]: ").strip() or "Jake Paul"
+
+        # Ask about multiprocessing
+        use_mp = input("\nUse multiprocessing for faster simulation? [Y/n]: ").strip().lower()
+        use_multiprocessing = use_mp != 'n' and not args.no_mp
+    else:
+        fighter1_name = args.fighter1 or "Anthony Joshua"
+        fighter2_name = args.fighter2 or "Jake Paul"
+        use_multiprocessing = not args.no_mp
     
     print("\n" + "="*60)
     
-    # Create DataFrames for fighters
-    fighter1_df = api.create_dataframe(fighter1_name)
-    fighter2_df = api.create_dataframe(fighter2_name)
+    # Fetch fighter stats (both lookups run concurrently; they are network-bound)
+    fighter1, fighter2 = api.create_fighters([fighter1_name, fighter2_name])
     
-    if fighter1_df is None or fighter2_df is None:
+    if fighter1 is None or fighter2 is None:
         print("\n❌ Error: One or both fighters not found.")
         print(f"\n💡 Try one of these fighters:")
         for name in available_fighters:
             print(f"   • {name}")
         return
     
-    # Run Monte Carlo simulation
-    results = monte_carlo_simulation(fighter1_df, fighter2_df, N, use_multiprocessing)
+    # Run Monte Carlo simulation (kernel compiled first so the timing is the run alone)
+    warmup_kernel()
+    results = monte_carlo_simulation(fighter1, fighter2, args.n, use_multiprocessing)
     
     # Print results
     print_results(results, fighter1_name, fighter2_name)
     
     # Plot results
-    print("📊 Generating visualization...")
-    plot_results(results, fighter1_name, fighter2_name)
+    if not args.no_plot:
+        print("📊 Generating visualization...")
+        plot_path = plot_results(results, fighter1_name, fighter2_name)
+        print(f"✓ Chart saved to {plot_path}")
     
-    # Display detailed statistics
+    # Display detailed statistics (from the fighters already loaded, with
+    # win_rate/ko_rate, so no further lookups are made)
+    import pandas as pd
     print("\n" + "="*60)
     print("DETAILED FIGHTER STATISTICS")
     print("="*60)
-    print(f"\n{fighter1_name}:")
-    print(fighter1_df.to_string(index=False))
-    print(f"\n{fighter2_name}:")
-    print(fighter2_df.to_string(index=False))
+    # Bounded formatting: long names/sources are clipped and row output is capped
+    for name, fighter in ((fighter1_name, fighter1), (fighter2_name, fighter2)):
+        print(f"\n{name}:")
+        print(pd.DataFrame([fighter.to_dict()]).to_string(index=False, max_rows=40, max_colwidth=40))
     print("\n" + "="*60)
     print("Simulation Complete! 🎉")
     print("="*60 + "\n")
 
 
+def run_web():
+    """Serve the web UI (waitress when installed, otherwise Flask's server)."""
+    app = create_app()
+    # Allow overriding via environment variable `PORT`, default to 5001 to avoid conflicts
+    try:
+        port = int(os.getenv('PORT', '5001'))
+    except Exception:
+        port = 5001
+    # Debug mode (reloader + debugger) only when asked for with FLASK_DEBUG=1
+    debug = _env_flag('FLASK_DEBUG', False)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    if serve is not None and not debug:
+        # Multi-threaded production server when waitress is installed
+        serve(app, host='0.0.0.0', port=port, threads=8)
+    else:
+        app.run(host='0.0.0.0', port=port, debug=debug)
+
+
 if __name__ == '__main__':
-    import sys
-    # Default: run web UI. Pass `cli` to run the interactive CLI instead.
+    # Default: run web UI. Pass `cli` (plus optional CLI flags) to run the CLI instead.
     if len(sys.argv) > 1 and sys.argv[1] == 'cli':
-        main()
+        main(sys.argv[2:])
     else:
-        app = create_app()
-        # Allow overriding via environment variable `PORT`, default to 5001 to avoid conflicts
-        try:
-            port = int(os.getenv('PORT', '5001'))
-        except Exception:
-            port = 5001
-        app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+        run_web()
@@ -1,13 +1,32 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the raw response bytes directly; fall back to the stdlib parser
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Test the free API with key 123
 url = "https://www.thesportsdb.com/api/v1/json/123/searchplayers.php"
 params = {"p": "Canelo Alvarez"}
 
-response = requests.get(url, params=params)
+# Keep-alive session that retries transient failures instead of failing the check
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                      max_retries=Retry(total=3, backoff_factor=0.2,
+                                        status_forcelist=[429, 500, 502, 503, 504],
+                                        allowed_methods=['GET'],
+                                        # hand back the last response once retries run out,
+                                        # rather than raising RetryError
+                                        raise_on_status=False))
+session.mount('https://', adapter)
+
+response = session.get(url, params=params, timeout=10)
 
 if response.status_code == 200:
-    data = response.json()
+    data = json_loads(response.content)
     print("✅ API Working!")
     if data.get('player'):
         player = data['player'][0]
@@ -20,7 +39,7 @@ if response.status_code == 200:
         # Print available keys for debugging if numeric fields missing
         if wins == 'N/A' or losses == 'N/A':
             print("⚠ Some record fields missing from API response. Available keys:")
-            for k in sorted(player.keys()):
-                print(f"  - {k}: {player[k]}")
+            for k, v in player.items():
+                print(f"  - {k}: {v}")
 else:
     print(f"❌ Error: {response.status_code}")
\ No newline at end of file
@@ -3,15 +3,22 @@
 Comprehensive API test with multiple boxers and matchups
 """
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from main import create_app
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-# Create the Flask app
-app = create_app()
+# orjson parses the response bytes directly; fall back to the stdlib parser
+try:
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
+
+# Simulations per matchup; set SIM_SMOKE_N (e.g. 5000) for a quick logic-only run
+N_SIM = int(os.getenv('SIM_SMOKE_N', 50_000))
 
 # Test cases with different fighters
 test_cases = [
@@ -22,50 +29,117 @@ test_cases = [
     ('Terence Crawford', 'Floyd Mayweather', 'Modern vs Historic greatness'),
 ]
 
-print("="*80)
-print("COMPREHENSIVE API TEST - MULTIPLE BOXERS")
-print("="*80)
-
-with app.test_client() as client:
-    for i, (f1, f2, description) in enumerate(test_cases, 1):
-        print(f"\n{i}. {f1.upper()} vs {f2.upper()}")
-        print(f"   ({description})")
-        print("-" * 80)
-        
-        response = client.post('/api/simulate', 
-            json={
-                'fighter1': f1, 
-                'fighter2': f2, 
-                'n_simulations': 50000
-            })
-        
-        data = json.loads(response.data)
-        
+
+def prefetch(app, name):
+    """Look one fighter up; each thread uses its own test client."""
+    return name, app.test_client().get('/api/fighter', query_string={'name': name})
+
+
+def run_case(app, case):
+    """POST one matchup; each thread uses its own test client."""
+    f1, f2, _ = case
+    response = app.test_client().post('/api/simulate',
+        json={
+            'fighter1': f1,
+            'fighter2': f2,
+            'n_simulations': N_SIM
+        })
+    return response, json_lib.loads(response.data)
+
+
+def main():
+    # Imported here so the module can be imported without building the app
+    from main import create_app
+
+    # Create the Flask app
+    app = create_app()
+
+    print("="*80)
+    print("COMPREHENSIVE API TEST - MULTIPLE BOXERS")
+    print("="*80)
+
+    # One client for the suite's sequential requests; the threaded helpers each
+    # open their own, since a test client's cookie jar isn't meant to be shared
+    client = app.test_client()
+
+    failures = 0
+
+    def check(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} {message}")
+
+    # Matchups of a fighter against himself are rejected, by name or by nickname
+    for f1, f2 in (('Canelo Alvarez', 'canelo alvarez'), ('AJ', 'Anthony Joshua')):
+        same = client.post('/api/simulate', json={'fighter1': f1, 'fighter2': f2})
+        check(same.status_code == 400, f"same-fighter guard: {f1!r} vs {f2!r} -> {same.status_code}")
+
+    # Prewarm the simulate path (kernel, JSON provider, plot writer) with a small
+    # run that isn't one of the test matchups, so the first case isn't charged for it
+    client.post('/api/simulate', json={'fighter1': 'Terence Crawford', 'fighter2': 'Anthony Joshua',
+                                       'n_simulations': 1000})
+
+    # Several fighters appear in more than one matchup: look each one up once,
+    # concurrently, so the server's fighter cache is warm and the matchups only
+    # run the simulation
+    unique_fighters = list(dict.fromkeys(f for pair in test_cases for f in pair[:2]))
+    with ThreadPoolExecutor(max_workers=len(unique_fighters)) as executor:
+        for name, resp in executor.map(partial(prefetch, app), unique_fighters):
+            if resp.status_code != 200:
+                print(f"  Prefetch miss for {name}: {resp.status_code}")
+    print(f"Prefetched {len(unique_fighters)} unique fighters for {len(test_cases)} matchups")
+
+    # The matchups are independent, so they are simulated concurrently; results
+    # are printed afterwards in test_cases order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        responses = list(executor.map(partial(run_case, app), test_cases))
+
+    # Each matchup's report is built in a buffer and written in one go
+    for i, ((f1, f2, description), (response, data)) in enumerate(zip(test_cases, responses), 1):
+        buf = io.StringIO()
+        print(f"\n{i}. {f1.upper()} vs {f2.upper()}", file=buf)
+        print(f"   ({description})", file=buf)
+        print("-" * 80, file=buf)
+
         if response.status_code == 404:
-            print(f"   ❌ ERROR: {data.get('error')}")
-            print(f"   Suggestion: {data.get('suggestion')}")
+            print(f"   ❌ ERROR: {data.get('error')}", file=buf)
+            print(f"   Suggestion: {data.get('suggestion')}", file=buf)
         elif response.status_code == 200:
-            results = data.get('results', {})
+            r = data.get('results', {})
+            a = data.get('fighter1', {})
+            b = data.get('fighter2', {})
             warnings = data.get('warnings', [])
-            f1_data = data.get('fighter1', {})
-            f2_data = data.get('fighter2', {})
-            
-            print(f"   ✅ SUCCESS")
-            print(f"   Fighter 1: {f1_data.get('name')} - {f1_data.get('wins')}-{f1_data.get('losses')}-{f1_data.get('draws')} ({f1_data.get('weight')} lbs)")
-            print(f"   Fighter 2: {f2_data.get('name')} - {f2_data.get('wins')}-{f2_data.get('losses')}-{f2_data.get('draws')} ({f2_data.get('weight')} lbs)")
-            print(f"\n   Results ({results.get('fighter1_wins', 0) + results.get('fighter2_wins', 0) + results.get('draws', 0):,} simulations):")
-            print(f"   {f1_data.get('name')}: {results.get('fighter1_win_pct', 0):.1f}%")
-            print(f"   {f2_data.get('name')}: {results.get('fighter2_win_pct', 0):.1f}%")
-            print(f"   Draws: {results.get('draw_pct', 0):.1f}%")
-            
+            name1, name2 = a.get('name'), b.get('name')
+            total = r.get('fighter1_wins', 0) + r.get('fighter2_wins', 0) + r.get('draws', 0)
+
+            lines = [
+                "   ✅ SUCCESS",
+                f"   Fighter 1: {name1} - {a.get('wins')}-{a.get('losses')}-{a.get('draws')} ({a.get('weight')} lbs)",
+                f"   Fighter 2: {name2} - {b.get('wins')}-{b.get('losses')}-{b.get('draws')} ({b.get('weight')} lbs)",
+                f"\n   Results ({total:,} simulations):",
+                f"   {name1}: {r.get('fighter1_win_pct', 0):.1f}%",
+                f"   {name2}: {r.get('fighter2_win_pct', 0):.1f}%",
+                f"   Draws: {r.get('draw_pct', 0):.1f}%",
+            ]
             if warnings:
-                print(f"\n   ⚠️  WARNINGS:")
-                for warning in warnings:
-                    print(f"   {warning}")
+                lines.append("\n   ⚠️  WARNINGS:")
+                lines.extend(f"   {warning}" for warning in warnings)
+            print('\n'.join(lines), file=buf)
         else:
-            print(f"   ❌ Unexpected status code: {response.status_code}")
-            print(f"   Response: {data}")
+            print(f"   ❌ Unexpected status code: {response.status_code}", file=buf)
+            print(f"   Response: {data}", file=buf)
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+    print("\n" + "="*80)
+    print("TEST COMPLETE")
+    print("="*80)
+
+    if failures:
+        print(f"✗ {failures} check(s) failed")
+        sys.exit(1)
+
 
-print("\n" + "="*80)
-print("TEST COMPLETE")
-print("="*80)
+if __name__ == '__main__':
+    main()
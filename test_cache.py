@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Test the /api/simulate result cache - repeat and mirrored matchups
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+# orjson parses the response bytes directly; fall back to the stdlib parser
+try:
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
+
+
+def main():
+    # Imported here so the module can be imported without building the app
+    from main import create_app
+
+    app = create_app()
+    client = app.test_client()
+    failures = 0
+
+    def simulate(f1, f2):
+        response = client.post('/api/simulate', json={'fighter1': f1, 'fighter2': f2, 'n_simulations': 10000})
+        return json_lib.loads(response.data)
+
+    def check(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} {message}")
+
+    print("="*80)
+    print("CACHE: Crawford vs Joshua, then Joshua vs Crawford")
+    print("="*80)
+    first = simulate('Terence Crawford', 'Anthony Joshua')
+    mirrored = simulate('Anthony Joshua', 'Terence Crawford')
+    a, b = first['results'], mirrored['results']
+
+    check(first['cached'] is False, "first request runs the simulation (cached: false)")
+    check(mirrored['cached'] is True, "mirrored request is served from the cache (cached: true)")
+    check(a['fighter1_wins'] == b['fighter2_wins'] and a['fighter2_wins'] == b['fighter1_wins'],
+          f"wins swapped exactly ({a['fighter1_wins']:,}/{a['fighter2_wins']:,} -> "
+          f"{b['fighter1_wins']:,}/{b['fighter2_wins']:,})")
+    check(a['fighter1_win_pct'] == b['fighter2_win_pct'] and a['fighter2_win_pct'] == b['fighter1_win_pct'],
+          "win percentages swapped exactly")
+    check(a['draws'] == b['draws'] and a['draw_pct'] == b['draw_pct'], "draws unchanged")
+    check(mirrored['fighter1']['name'] == 'Anthony Joshua', "fighter1 in the response is the requested one")
+    print("="*80)
+
+    if failures:
+        print(f"✗ {failures} cache check(s) failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
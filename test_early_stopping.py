@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Test early stopping (tolerance) in monte_carlo_simulation
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from main import _ci_half_width, monte_carlo_simulation
+
+N_SIM = 200_000
+TOLERANCE = 0.005
+
+# Lopsided matchup: the win rates converge quickly, so the run should stop early
+fury_stats = {
+    'name': 'Tyson Fury',
+    'wins': 34,
+    'losses': 0,
+    'draws': 1,
+    'total_bouts': 35,
+    'ko_wins': 24,
+    'height': 206,
+    'reach': 216,
+    'weight': 270
+}
+
+lomachenko_stats = {
+    'name': 'Vasiliy Lomachenko',
+    'wins': 17,
+    'losses': 3,
+    'draws': 0,
+    'total_bouts': 20,
+    'ko_wins': 11,
+    'height': 170,
+    'reach': 166,
+    'weight': 135
+}
+
+failures = 0
+
+
+def check(ok, message):
+    global failures
+    failures += not ok
+    return f"  {'✓' if ok else '✗'} {message}"
+
+
+early = monte_carlo_simulation(fury_stats, lomachenko_stats, n_simulations=N_SIM, tolerance=TOLERANCE)
+full = monte_carlo_simulation(fury_stats, lomachenko_stats, n_simulations=N_SIM)
+untouched = monte_carlo_simulation(fury_stats, lomachenko_stats, n_simulations=N_SIM, tolerance=None)
+
+ran = early['n_simulations']
+counted = early['fighter1_wins'] + early['fighter2_wins'] + early['draws']
+# The early estimate should sit within its tolerance of the full run, allowing
+# for the full run's own 99% interval
+gap = abs(early['fighter1_win_pct'] - full['fighter1_win_pct']) / 100
+allowed = TOLERANCE + _ci_half_width(full['fighter1_wins'], full['n_simulations'])
+
+lines = [
+    "="*80,
+    f"EARLY STOPPING: Fury vs Lomachenko (tolerance ±{TOLERANCE:.1%}, up to {N_SIM:,} fights)",
+    "="*80,
+    f"  Early stop: {ran:,} fights | Fury {early['fighter1_win_pct']:.2f}%",
+    f"  Full run:   {full['n_simulations']:,} fights | Fury {full['fighter1_win_pct']:.2f}%",
+    "",
+    check(ran < N_SIM, f"stopped before n_simulations ({ran:,} < {N_SIM:,})"),
+    check(counted == ran, f"reports the fights actually run (outcomes sum to {counted:,})"),
+    check(gap <= allowed, f"within tolerance of the full run (gap {gap:.2%} <= {allowed:.2%})"),
+    check(all(untouched[k] == full[k] for k in ('n_simulations', 'fighter1_wins', 'fighter2_wins', 'draws')),
+          "tolerance=None gives the same counts as no tolerance"),
+    "="*80,
+]
+print('\n'.join(lines))
+
+if failures:
+    print(f"✗ {failures} early-stopping check(s) failed")
+    sys.exit(1)
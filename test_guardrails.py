@@ -3,49 +3,75 @@
 Test user data guardrails - test spelling errors and missing fighters
 """
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from main import create_app
-import json
-
-# Create the Flask app
-app = create_app()
-
-# Test with Flask test client
-with app.test_client() as client:
-    print("="*80)
-    print("TEST 1: Valid fighters (Crawford vs Joshua)")
-    print("="*80)
-    response = client.post('/api/simulate', 
-        json={'fighter1': 'Terence Crawford', 'fighter2': 'Anthony Joshua', 'n_simulations': 10000})
-    data = json.loads(response.data)
-    print(f"Status: {response.status_code}")
-    print(f"Warnings: {data.get('warnings', [])}")
-    if 'error' in data:
-        print(f"Error: {data['error']}")
-    print()
-    
-    print("="*80)
-    print("TEST 2: Misspelled fighter (Anthonny Joshua - typo)")
-    print("="*80)
-    response = client.post('/api/simulate', 
-        json={'fighter1': 'Terence Crawford', 'fighter2': 'Anthonny Joshua', 'n_simulations': 10000})
-    data = json.loads(response.data)
-    print(f"Status: {response.status_code}")
-    print(f"Error: {data.get('error', 'No error')}")
-    print(f"Suggestion: {data.get('suggestion', 'No suggestion')}")
-    print(f"Available fighters: {data.get('available_fighters', [])[:3]}... (showing first 3)")
-    print()
-    
-    print("="*80)
-    print("TEST 3: Unknown fighter (Fake Fighter)")
-    print("="*80)
-    response = client.post('/api/simulate', 
-        json={'fighter1': 'Terence Crawford', 'fighter2': 'Fake Fighter', 'n_simulations': 10000})
-    data = json.loads(response.data)
-    print(f"Status: {response.status_code}")
-    print(f"Error: {data.get('error', 'No error')}")
-    print(f"Suggestion: {data.get('suggestion', 'No suggestion')}")
-    print()
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# orjson parses the response bytes directly; fall back to the stdlib parser
+try:
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
+
+# How each reported response key is printed: (label, default, formatter)
+FIELDS = {
+    'warnings': ("Warnings", [], str),
+    'error': ("Error", 'No error', str),
+    'suggestion': ("Suggestion", 'No suggestion', str),
+    'available_fighters': ("Available fighters", [], lambda names: f"{names[:3]}... (showing first 3)"),
+}
+
+# (title, fighter1, fighter2, fields to print after the status)
+cases = [
+    ("TEST 1: Valid fighters (Crawford vs Joshua)", 'Terence Crawford', 'Anthony Joshua',
+     ('warnings',)),
+    ("TEST 2: Misspelled fighter (Anthonny Joshua - typo)", 'Terence Crawford', 'Anthonny Joshua',
+     ('error', 'suggestion', 'available_fighters')),
+    ("TEST 3: Unknown fighter (Fake Fighter)", 'Terence Crawford', 'Fake Fighter',
+     ('error', 'suggestion')),
+]
+
+
+def run_case(app, case):
+    """POST one guardrail case; each thread uses its own test client."""
+    _, f1, f2, _ = case
+    response = app.test_client().post('/api/simulate',
+        json={'fighter1': f1, 'fighter2': f2, 'n_simulations': 10000})
+    return response, json_lib.loads(response.data)
+
+
+def main():
+    # Imported here so the module can be imported without building the app
+    from main import create_app
+
+    # Create the Flask app
+    app = create_app()
+
+    # The three cases are independent, so their POSTs run concurrently;
+    # reports are printed afterwards in case order
+    with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+        responses = list(executor.map(partial(run_case, app), cases))
+
+    for (title, _, _, fields), (response, data) in zip(cases, responses):
+        buf = io.StringIO()
+        print("="*80, file=buf)
+        print(title, file=buf)
+        print("="*80, file=buf)
+        print(f"Status: {response.status_code}", file=buf)
+        for field in fields:
+            label, default, fmt = FIELDS[field]
+            print(f"{label}: {fmt(data.get(field, default))}", file=buf)
+        # A successful case still reports an unexpected error
+        if 'error' not in fields and 'error' in data:
+            print(f"Error: {data['error']}", file=buf)
+        print(file=buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
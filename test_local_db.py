@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Test that curated local DB fighters (and their nicknames) resolve without the network
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from main import BoxingAPI
+
+
+def no_network(*args, **kwargs):
+    raise AssertionError(f"unexpected network call: {args[:1]}")
+
+
+def main():
+    api = BoxingAPI(api_key=None, use_local_fallback=True)
+    # Any HTTP request from either session fails the test
+    api.session.get = no_network
+    api.rapid_session.get = no_network
+    failures = 0
+
+    print("="*80)
+    print("LOCAL DB: nickname and case-insensitive lookups")
+    print("="*80)
+    for query in ('aj', 'anthony joshua', 'AJ', 'Anthony Joshua'):
+        try:
+            stats = api.get_fighter_stats(query)
+            ok = bool(stats) and stats['name'] == 'Anthony Joshua' and stats['source'] == 'local_db'
+            detail = f"{stats['name']} ({stats['source']})" if stats else "not found"
+        except AssertionError as e:
+            ok, detail = False, str(e)
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} {query!r:<18} -> {detail}")
+    print("="*80)
+
+    if failures:
+        print(f"✗ {failures} local DB lookup(s) failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,14 +3,15 @@
 Test script to verify simulation logic with different fighter matchups
 """
 
-import pandas as pd
-import numpy as np
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from main import monte_carlo_simulation
 
+# Simulations per matchup; set SIM_SMOKE_N (e.g. 5000) for a quick logic-only run
+N_SIM = int(os.getenv('SIM_SMOKE_N', 100_000))
+
 # Test 1: Tyson Fury vs Canelo Alvarez (significant weight difference)
 # Fury: Heavyweight (270 lbs), undefeated, great record
 # Canelo: Super middleweight (168 lbs), excellent record but smaller
@@ -50,10 +51,8 @@ print(f"  Experience: Canelo much more experienced (66 vs 35 bouts)")
 print(f"  KO Rate (NEW): Fury {24/35:.1%} vs Canelo {39/66:.1%}")
 print("="*80)
 
-f1_df = pd.DataFrame([fury_stats])
-f2_df = pd.DataFrame([canelo_stats])
-
-results = monte_carlo_simulation(f1_df, f2_df, n_simulations=100_000, use_multiprocessing=True)
+# monte_carlo_simulation takes the stats dicts directly
+results = monte_carlo_simulation(fury_stats, canelo_stats, n_simulations=N_SIM, use_multiprocessing=True)
 
 print(f"\n{'─'*80}")
 print(f"RESULTS: Fury {results['fighter1_win_pct']:.1f}% | Canelo {results['fighter2_win_pct']:.1f}%")
@@ -105,10 +104,7 @@ print(f"  KO Power: Tyson {44/56:.1%} vs Floyd {27/50:.1%} (Tyson more KO-prone)
 print(f"  Style: Floyd = defensive; Tyson = aggressive power puncher")
 print("="*80)
 
-f3_df = pd.DataFrame([floyd_stats])
-f4_df = pd.DataFrame([tyson_stats])
-
-results2 = monte_carlo_simulation(f3_df, f4_df, n_simulations=100_000, use_multiprocessing=True)
+results2 = monte_carlo_simulation(floyd_stats, tyson_stats, n_simulations=N_SIM, use_multiprocessing=True)
 
 print(f"\n{'─'*80}")
 print(f"RESULTS: Floyd {results2['fighter1_win_pct']:.1f}% | Tyson {results2['fighter2_win_pct']:.1f}%")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Check that the reduced 6-normal scoring model matches the original 12-normal one
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import numpy as np
+
+from main import (NUMBA_AVAILABLE, _record_rates, run_simulation_kernel, simulate_batch,
+                  std_height, std_reach)
+
+N_SIM = int(os.getenv('SIM_SMOKE_N', 400_000))
+
+matchups = [
+    (
+        {'name': 'Terence Crawford', 'wins': 42, 'losses': 0, 'draws': 0, 'total_bouts': 42,
+         'ko_wins': 31, 'height': 178, 'reach': 183, 'weight': 147},
+        {'name': 'Anthony Joshua', 'wins': 28, 'losses': 3, 'draws': 0, 'total_bouts': 31,
+         'ko_wins': 25, 'height': 198, 'reach': 208, 'weight': 240},
+    ),
+    (
+        {'name': 'Floyd Mayweather', 'wins': 50, 'losses': 0, 'draws': 0, 'total_bouts': 50,
+         'ko_wins': 27, 'height': 173, 'reach': 183, 'weight': 147},
+        {'name': 'Manny Pacquiao', 'wins': 62, 'losses': 8, 'draws': 2, 'total_bouts': 72,
+         'ko_wins': 39, 'height': 166, 'reach': 170, 'weight': 147},
+    ),
+]
+
+
+def original_model(n, f1, f2, std_f1_win, std_f2_win, std_f1_ko, std_f2_ko,
+                   fighter1_win, fighter2_win, ko_fighter1, ko_fighter2, seed):
+    """The original per-fighter scoring (12 normal draws per fight), vectorized."""
+    rng = np.random.default_rng(seed)
+    f1_win_sample = rng.normal(fighter1_win, std_f1_win, n)
+    f2_win_sample = rng.normal(fighter2_win, std_f2_win, n)
+    f1_ko_sample = rng.normal(ko_fighter1, std_f1_ko, n)
+    f2_ko_sample = rng.normal(ko_fighter2, std_f2_ko, n)
+    height_advantage = (rng.normal(f1['height'], std_height, n) - rng.normal(f2['height'], std_height, n)) / 200
+    reach_advantage = (rng.normal(f1['reach'], std_reach, n) - rng.normal(f2['reach'], std_reach, n)) / 200
+    weight_advantage = (rng.normal(f1['weight'], 5, n) - rng.normal(f2['weight'], 5, n)) / 460
+
+    fighter1_score = (f1_win_sample * 0.37 + f1_ko_sample * 0.15 + height_advantage * 0.08 +
+                      reach_advantage * 0.05 + weight_advantage * 0.35 + rng.normal(0, 0.1, n))
+    fighter2_score = (f2_win_sample * 0.37 + f2_ko_sample * 0.15 - height_advantage * 0.08 -
+                      reach_advantage * 0.05 - weight_advantage * 0.35 + rng.normal(0, 0.1, n))
+
+    diff = fighter1_score - fighter2_score
+    draws = int(np.count_nonzero(np.abs(diff) < 0.02))
+    fighter1_wins = int(np.count_nonzero(diff >= 0.02))
+    return fighter1_wins, n - fighter1_wins - draws, draws
+
+
+def agree(a, b, n):
+    """True if two outcome counts over n fights each agree within 4 standard errors."""
+    for x, y in zip(a, b):
+        p = (x + y) / (2 * n)
+        if abs(x - y) / n > 4 * np.sqrt(2 * p * (1 - p) / n) + 1e-12:
+            return False
+    return True
+
+
+def pct(counts, n):
+    return ' / '.join(f"{100 * c / n:.2f}%" for c in counts)
+
+
+failures = 0
+print("="*80)
+print(f"MODEL EQUIVALENCE: 12-normal original vs 6-normal reduced ({N_SIM:,} fights each)")
+print("="*80)
+
+for f1, f2 in matchups:
+    f1_win, std_f1_win, ko_f1, std_f1_ko = _record_rates(f1['wins'], f1['ko_wins'], f1['total_bouts'])
+    f2_win, std_f2_win, ko_f2, std_f2_ko = _record_rates(f2['wins'], f2['ko_wins'], f2['total_bouts'])
+    params = (f1, f2, std_f1_win, std_f2_win, std_f1_ko, std_f2_ko, f1_win, f2_win, ko_f1, ko_f2)
+
+    results = {
+        'original (12 normals)': original_model(N_SIM, *params, seed=1),
+        'simulate_batch': simulate_batch(N_SIM, *params, seed=2),
+    }
+    if NUMBA_AVAILABLE:
+        results['Numba kernel'] = run_simulation_kernel(N_SIM, *params, seed=3)
+
+    print(f"\n{f1['name']} vs {f2['name']}  (fighter 1 / fighter 2 / draws)")
+    reference = results.pop('original (12 normals)')
+    print(f"    {'original (12 normals)':<22} {pct(reference, N_SIM)}")
+    for label, counts in results.items():
+        ok = agree(reference, counts, N_SIM)
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} {label:<22} {pct(counts, N_SIM)}")
+
+    if NUMBA_AVAILABLE:
+        ok = agree(results['simulate_batch'], results['Numba kernel'], N_SIM)
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} simulate_batch and Numba kernel agree")
+
+print("\n" + "="*80)
+if failures:
+    print(f"✗ {failures} comparison(s) outside Monte Carlo error")
+    sys.exit(1)
+print("✓ All rates agree within Monte Carlo error (4 standard errors)")
+print("="*80)
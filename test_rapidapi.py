@@ -3,8 +3,26 @@
 Test the RapidAPI boxing-data-api to understand available endpoints
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json
+
+# orjson parses the raw response bytes directly and pretty-prints in native
+# code; fall back to the stdlib json module (which accepts bytes too)
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def to_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+    def to_json(obj):
+        return json.dumps(obj, indent=2)
 
 # RapidAPI credentials
 RAPIDAPI_HOST = "boxing-data-api.p.rapidapi.com"
@@ -15,6 +33,10 @@ headers = {
     "x-rapidapi-key": RAPIDAPI_KEY
 }
 
+# One keep-alive session for every probe, so only the first pays the TLS handshake
+session = requests.Session()
+session.headers.update(headers)
+
 print("="*80)
 print("EXPLORING BOXING-DATA-API ENDPOINTS")
 print("="*80)
@@ -31,12 +53,12 @@ params = {
 }
 
 try:
-    response = requests.get(url, headers=headers, params=params, timeout=10)
+    response = session.get(url, params=params, timeout=10)
     print(f"Status: {response.status_code}")
-    data = response.json()
+    data = json_loads(response.content)
     print(f"Response keys: {list(data.keys())}")
     if data.get('data'):
-        print(f"First event: {json.dumps(data['data'][0], indent=2)[:500]}...")
+        print(f"First event: {to_json(data['data'][0])[:500]}...")
 except Exception as e:
     print(f"Error: {e}")
 
@@ -48,16 +70,31 @@ possible_endpoints = [
     "/v1/search",
 ]
 
-for endpoint in possible_endpoints:
-    url = f"https://boxing-data-api.p.rapidapi.com{endpoint}"
+
+def probe(endpoint):
+    """GET one candidate endpoint; returns the response or the exception raised."""
+    try:
+        return session.get(f"https://boxing-data-api.p.rapidapi.com{endpoint}",
+                           params={"q": "Crawford"}, timeout=10)
+    except Exception as e:
+        return e
+
+
+# The probes are independent, so they overlap on a few threads (one round
+# trip instead of three); results are printed in endpoint order
+with ThreadPoolExecutor(max_workers=len(possible_endpoints)) as executor:
+    probes = list(executor.map(probe, possible_endpoints))
+
+for endpoint, response in zip(possible_endpoints, probes):
     print(f"\n  Trying {endpoint}...")
     try:
-        response = requests.get(url, headers=headers, params={"q": "Crawford"}, timeout=10)
+        if isinstance(response, Exception):
+            raise response
         print(f"    Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             print(f"    Response keys: {list(data.keys())}")
-            print(f"    Data: {json.dumps(data, indent=2)[:300]}...")
+            print(f"    Data: {to_json(data)[:300]}...")
     except Exception as e:
         print(f"    Error: {e}")
 
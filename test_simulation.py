@@ -3,8 +3,6 @@
 Test script to simulate Crawford vs Joshua with updated logic
 """
 
-import pandas as pd
-import numpy as np
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
@@ -46,13 +44,9 @@ print("✓ Weight Class: Added 15% weight advantage weighting")
 print("✓ Weight Diff: Crawford 147 lbs vs Joshua 240 lbs = 93 lbs advantage")
 print("="*70)
 
-# Create DataFrames
-f1_df = pd.DataFrame([crawford_stats])
-f2_df = pd.DataFrame([joshua_stats])
-
-# Run simulation with 100,000 simulations
-n_simulations = 100_000
-results = monte_carlo_simulation(f1_df, f2_df, n_simulations=n_simulations, use_multiprocessing=True)
+# Run 100,000 simulations (SIM_SMOKE_N overrides, e.g. 5000 for a quick run)
+n_simulations = int(os.getenv('SIM_SMOKE_N', 100_000))
+results = monte_carlo_simulation(crawford_stats, joshua_stats, n_simulations=n_simulations, use_multiprocessing=True)
 
 # Print results
 print(f"\n{'='*70}")